@@ -6,6 +6,8 @@ import streamlit as st
 from typing import List, Dict, Optional
 import boto3
 from botocore.exceptions import ClientError
+from config_settings import AppConfig
+from utils_helpers import Helpers
 
 class S3Service:
     """S3 operations"""
@@ -13,29 +15,41 @@ class S3Service:
     def __init__(self, session: boto3.Session):
         """Initialize S3 service"""
         self.session = session
-        self.client = session.client('s3')
+        self.client = session.client('s3', config=AppConfig.BOTO_CONFIG)
+    
+    def _bucket_region(_self, bucket_name: str) -> str:
+        """Resolve a bucket's region via GetBucketLocation"""
+        try:
+            location = _self.client.get_bucket_location(Bucket=bucket_name)
+            constraint = location.get('LocationConstraint')
+            # Buckets in us-east-1 report no constraint; legacy eu-west-1 buckets report 'EU'
+            return {None: 'us-east-1', '': 'us-east-1', 'EU': 'eu-west-1'}.get(constraint, constraint)
+        except ClientError:
+            return 'unknown'
     
     def list_buckets(_self) -> Dict:
         """List all S3 buckets"""
         try:
             response = _self.client.list_buckets()
+            bucket_list = response.get('Buckets', [])
+            
+            # ListBuckets includes BucketRegion on current APIs; only look up the rest,
+            # concurrently, since GetBucketLocation is one call per bucket
+            missing = [b['Name'] for b in bucket_list if not b.get('BucketRegion')]
+            regions = {}
+            if missing:
+                with Helpers.thread_pool(max_workers=20) as executor:
+                    regions = dict(zip(missing, executor.map(_self._bucket_region, missing)))
             
             buckets = []
-            for bucket in response.get('Buckets', []):
+            for bucket in bucket_list:
                 bucket_name = bucket['Name']
                 
-                # Get bucket region
-                try:
-                    location = _self.client.get_bucket_location(Bucket=bucket_name)
-                    region = location.get('LocationConstraint') or 'us-east-1'
-                except:
-                    region = 'unknown'
-                
                 # Get bucket size (simplified - would need CloudWatch in production)
                 buckets.append({
                     'bucket_name': bucket_name,
                     'creation_date': bucket['CreationDate'],
-                    'region': region
+                    'region': bucket.get('BucketRegion') or regions.get(bucket_name, 'unknown')
                 })
             
             return {
@@ -59,7 +73,7 @@ class LambdaService:
         """Initialize Lambda service"""
         self.session = session
         self.region = region
-        self.client = session.client('lambda', region_name=region)
+        self.client = session.client('lambda', region_name=region, config=AppConfig.BOTO_CONFIG)
     
     def list_functions(_self) -> Dict:
         """List all Lambda functions"""
@@ -102,7 +116,7 @@ class DynamoDBService:
         """Initialize DynamoDB service"""
         self.session = session
         self.region = region
-        self.client = session.client('dynamodb', region_name=region)
+        self.client = session.client('dynamodb', region_name=region, config=AppConfig.BOTO_CONFIG)
     
     def list_tables(_self) -> Dict:
         """List all DynamoDB tables"""
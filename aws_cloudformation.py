@@ -9,13 +9,14 @@ import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from core_account_manager import get_account_manager
+from config_settings import AppConfig
 
 class CloudFormationManager:
     """AWS CloudFormation Stack Management"""
     
-    def __init__(self, session):
-        """Initialize CloudFormation manager with boto3 session"""
-        self.cfn_client = session.client('cloudformation')
+    def __init__(self, session, region: Optional[str] = None):
+        """Initialize CloudFormation manager with boto3 session (region defaults to the session's)"""
+        self.cfn_client = session.client('cloudformation', region_name=region, config=AppConfig.BOTO_CONFIG)
     
     # ============= STACK OPERATIONS =============
     
@@ -24,9 +25,11 @@ class CloudFormationManager:
         List CloudFormation stacks
         
         Args:
-            status_filter: List of statuses to filter (e.g., ['CREATE_COMPLETE', 'UPDATE_COMPLETE'])
+            status_filter: List of statuses to filter (e.g., ['CREATE_COMPLETE', 'UPDATE_COMPLETE']),
+                applied server-side via StackStatusFilter
         """
         try:
+            # ListStacks has a fixed page size, so there is no PageSize to tune here
             params = {}
             if status_filter:
                 params['StackStatusFilter'] = status_filter
@@ -408,20 +411,21 @@ class CloudFormationManager:
     # ============= STACK EVENTS =============
     
     def get_stack_events(self, stack_name: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get recent events for a stack"""
+        """Get recent events for a stack (newest first, stops after `limit` events)"""
         try:
-            response = self.cfn_client.describe_stack_events(StackName=stack_name)
-            
             events = []
-            for event in response['StackEvents'][:limit]:
-                events.append({
-                    'timestamp': event['Timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                    'logical_id': event['LogicalResourceId'],
-                    'physical_id': event.get('PhysicalResourceId', 'N/A'),
-                    'resource_type': event['ResourceType'],
-                    'status': event['ResourceStatus'],
-                    'reason': event.get('ResourceStatusReason', '')
-                })
+            paginator = self.cfn_client.get_paginator('describe_stack_events')
+            
+            for page in paginator.paginate(StackName=stack_name, PaginationConfig={'MaxItems': limit}):
+                for event in page['StackEvents']:
+                    events.append({
+                        'timestamp': event['Timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
+                        'logical_id': event['LogicalResourceId'],
+                        'physical_id': event.get('PhysicalResourceId', 'N/A'),
+                        'resource_type': event['ResourceType'],
+                        'status': event['ResourceStatus'],
+                        'reason': event.get('ResourceStatusReason', '')
+                    })
             
             return events
         except Exception as e:
@@ -6,16 +6,18 @@ Supports metrics, logs, alarms, dashboards, and insights
 import streamlit as st
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
+from itertools import chain
 from core_account_manager import get_account_manager
+from config_settings import AppConfig
 
 class CloudWatchManager:
     """AWS CloudWatch Monitoring and Logging"""
     
     def __init__(self, session):
         """Initialize CloudWatch manager with boto3 session"""
-        self.cloudwatch = session.client('cloudwatch')
-        self.logs = session.client('logs')
-        self.events = session.client('events')
+        self.cloudwatch = session.client('cloudwatch', config=AppConfig.BOTO_CONFIG)
+        self.logs = session.client('logs', config=AppConfig.BOTO_CONFIG)
+        self.events = session.client('events', config=AppConfig.BOTO_CONFIG)
     
     # ============= METRICS =============
     
@@ -113,12 +115,15 @@ class CloudWatchManager:
     
     # ============= ALARMS =============
     
-    def list_alarms(self, state_value: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List CloudWatch alarms"""
+    def list_alarms(self, state_value: Optional[str] = None,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List CloudWatch alarms, stopping after `limit` alarms when given"""
         try:
             params = {}
             if state_value:
                 params['StateValue'] = state_value
+            if limit:
+                params['PaginationConfig'] = {'MaxItems': limit}
             
             alarms = []
             paginator = self.cloudwatch.get_paginator('describe_alarms')
@@ -207,12 +212,15 @@ class CloudWatchManager:
     
     # ============= LOG GROUPS & STREAMS =============
     
-    def list_log_groups(self, prefix: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List CloudWatch Log Groups"""
+    def list_log_groups(self, prefix: Optional[str] = None,
+                        limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List CloudWatch Log Groups, stopping after `limit` groups when given"""
         try:
             params = {}
             if prefix:
                 params['logGroupNamePrefix'] = prefix
+            if limit:
+                params['PaginationConfig'] = {'MaxItems': limit}
             
             log_groups = []
             paginator = self.logs.get_paginator('describe_log_groups')
@@ -319,24 +327,33 @@ class CloudWatchManager:
     def filter_log_events(self, log_group_name: str, filter_pattern: str,
                          start_time: Optional[datetime] = None,
                          end_time: Optional[datetime] = None,
-                         limit: int = 100) -> List[Dict[str, Any]]:
-        """Filter log events across all streams"""
+                         limit: int = 100,
+                         log_stream_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Filter log events across all streams, or only the given streams
+        
+        Matching is done by CloudWatch and returned oldest-first. Pages can come
+        back empty while more of the time range is still being searched, so
+        pages are followed until `limit` events have matched.
+        """
         try:
             params = {
                 'logGroupName': log_group_name,
                 'filterPattern': filter_pattern,
-                'limit': limit
+                'PaginationConfig': {'MaxItems': limit}
             }
             
+            if log_stream_names:
+                params['logStreamNames'] = log_stream_names
             if start_time:
                 params['startTime'] = int(start_time.timestamp() * 1000)
             if end_time:
                 params['endTime'] = int(end_time.timestamp() * 1000)
             
-            response = self.logs.filter_log_events(**params)
+            paginator = self.logs.get_paginator('filter_log_events')
             
             events = []
-            for event in response.get('events', []):
+            for event in chain.from_iterable(page.get('events', []) for page in paginator.paginate(**params)):
                 events.append({
                     'timestamp': datetime.fromtimestamp(event['timestamp']/1000).strftime('%Y-%m-%d %H:%M:%S'),
                     'log_stream_name': event['logStreamName'],
@@ -7,6 +7,7 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import boto3
 from botocore.exceptions import ClientError
+from config_settings import AppConfig
 
 class EC2Service:
     """EC2 operations across accounts and regions"""
@@ -15,19 +16,30 @@ class EC2Service:
         """Initialize EC2 service"""
         self.session = session
         self.region = region
-        self.client = session.client('ec2', region_name=region)
+        self.client = session.client('ec2', region_name=region, config=AppConfig.BOTO_CONFIG)
     
-    def list_instances(_self, filters: Optional[List[Dict]] = None) -> Dict:
+    def list_instances(_self, filters: Optional[List[Dict]] = None,
+                       state_filter: Optional[List[str]] = None) -> Dict:
         """
         List all EC2 instances
         
+        Args:
+            filters: Raw DescribeInstances filters
+            state_filter: Instance states to return (e.g., ['running', 'stopped']),
+                applied server-side via the instance-state-name filter
+        
         Returns:
             Dict with instances list and metadata
         """
         try:
-            params = {}
+            # 1000 is the DescribeInstances maximum; fewer round trips on large accounts
+            params = {'PaginationConfig': {'PageSize': 1000}}
             if filters:
-                params['Filters'] = filters
+                params['Filters'] = list(filters)
+            if state_filter:
+                params.setdefault('Filters', []).append(
+                    {'Name': 'instance-state-name', 'Values': list(state_filter)}
+                )
             
             instances = []
             paginator = _self.client.get_paginator('describe_instances')
@@ -35,8 +47,10 @@ class EC2Service:
             for page in paginator.paginate(**params):
                 for reservation in page['Reservations']:
                     for instance in reservation['Instances']:
+                        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
                         instances.append({
                             'instance_id': instance['InstanceId'],
+                            'name': tags.get('Name', 'N/A'),
                             'instance_type': instance['InstanceType'],
                             'state': instance['State']['Name'],
                             'launch_time': instance['LaunchTime'],
@@ -45,7 +59,7 @@ class EC2Service:
                             'public_ip': instance.get('PublicIpAddress', 'N/A'),
                             'vpc_id': instance.get('VpcId', 'N/A'),
                             'subnet_id': instance.get('SubnetId', 'N/A'),
-                            'tags': {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])},
+                            'tags': tags,
                             'platform': instance.get('Platform', 'Linux'),
                             'monitoring': instance['Monitoring']['State'],
                             'key_name': instance.get('KeyName', 'N/A')
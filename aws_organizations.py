@@ -9,14 +9,15 @@ import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from core_account_manager import get_account_manager
+from config_settings import AppConfig
 
 class AWSOrganizationsManager:
     """AWS Organizations Management for Account Provisioning"""
     
     def __init__(self, session):
         """Initialize Organizations manager with boto3 session"""
-        self.org_client = session.client('organizations')
-        self.sts_client = session.client('sts')
+        self.org_client = session.client('organizations', config=AppConfig.BOTO_CONFIG)
+        self.sts_client = session.client('sts', config=AppConfig.BOTO_CONFIG)
     
     # ============= ORGANIZATION INFO =============
     
@@ -6,6 +6,7 @@ import streamlit as st
 from typing import List, Dict, Optional
 import boto3
 from botocore.exceptions import ClientError
+from config_settings import AppConfig
 
 class RDSService:
     """RDS operations across accounts and regions"""
@@ -14,7 +15,7 @@ class RDSService:
         """Initialize RDS service"""
         self.session = session
         self.region = region
-        self.client = session.client('rds', region_name=region)
+        self.client = session.client('rds', region_name=region, config=AppConfig.BOTO_CONFIG)
     
     def list_db_instances(_self) -> Dict:
         """List all RDS database instances"""
@@ -22,7 +23,8 @@ class RDSService:
             instances = []
             paginator = _self.client.get_paginator('describe_db_instances')
             
-            for page in paginator.paginate():
+            # 100 is the DescribeDBInstances maximum
+            for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
                 for db in page['DBInstances']:
                     instances.append({
                         'db_instance_id': db['DBInstanceIdentifier'],
@@ -5,18 +5,28 @@ Supports Security Hub, GuardDuty, AWS Config, and compliance management
 
 import streamlit as st
 from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from core_account_manager import get_account_manager
+from config_settings import AppConfig
+
+@dataclass(frozen=True, slots=True)
+class ComplianceSummary:
+    """AWS Config rule compliance counts"""
+    total_rules: int = 0
+    compliant: int = 0
+    non_compliant: int = 0
+    compliance_percentage: float = 0.0
 
 class SecurityManager:
     """AWS Security Hub, GuardDuty, and Config Management"""
     
     def __init__(self, session):
         """Initialize security manager with boto3 session"""
-        self.security_hub = session.client('securityhub')
-        self.guardduty = session.client('guardduty')
-        self.config = session.client('config')
-        self.iam = session.client('iam')
+        self.security_hub = session.client('securityhub', config=AppConfig.BOTO_CONFIG)
+        self.guardduty = session.client('guardduty', config=AppConfig.BOTO_CONFIG)
+        self.config = session.client('config', config=AppConfig.BOTO_CONFIG)
+        self.iam = session.client('iam', config=AppConfig.BOTO_CONFIG)
     
     # ============= SECURITY HUB =============
     
@@ -60,45 +70,65 @@ class SecurityManager:
             st.error(f"Error getting Security Hub summary: {str(e)}")
             return {'total_findings': 0, 'severity_counts': {}, 'enabled_standards': 0}
     
-    def list_security_findings(self, severity: Optional[str] = None, 
-                              limit: int = 100) -> List[Dict[str, Any]]:
-        """List security findings from Security Hub"""
+    @staticmethod
+    def _findings_filters(severity: Optional[str]) -> Dict[str, Any]:
+        """GetFindings filters for active findings, optionally of one severity"""
+        filters = {
+            'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]
+        }
+        
+        if severity:
+            filters['SeverityLabel'] = [{'Value': severity, 'Comparison': 'EQUALS'}]
+        
+        return filters
+    
+    @staticmethod
+    def _finding_summary(finding: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a Security Hub finding into the fields the UI shows"""
+        return {
+            'id': finding.get('Id', ''),
+            'title': finding.get('Title', ''),
+            'description': finding.get('Description', ''),
+            'severity': finding.get('Severity', {}).get('Label', 'INFORMATIONAL'),
+            'resource_type': finding.get('Resources', [{}])[0].get('Type', 'Unknown'),
+            'resource_id': finding.get('Resources', [{}])[0].get('Id', 'Unknown'),
+            'compliance_status': finding.get('Compliance', {}).get('Status', 'NOT_AVAILABLE'),
+            'workflow_status': finding.get('Workflow', {}).get('Status', 'NEW'),
+            'created_at': finding.get('CreatedAt', ''),
+            'updated_at': finding.get('UpdatedAt', ''),
+            'remediation': finding.get('Remediation', {}).get('Recommendation', {}).get('Text', '')
+        }
+    
+    def get_security_findings_page(self, severity: Optional[str] = None,
+                                   page_size: int = 50,
+                                   next_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of security findings from Security Hub
+        
+        Returns:
+            Dict with the page's findings and the token for the next page
+            (None when there are no more findings)
+        """
         try:
-            filters = {
-                'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]
+            params = {
+                'Filters': self._findings_filters(severity),
+                'SortCriteria': [
+                    {'Field': 'SeverityLabel', 'SortOrder': 'desc'}
+                ],
+                'MaxResults': page_size
             }
+            if next_token:
+                params['NextToken'] = next_token
             
-            if severity:
-                filters['SeverityLabel'] = [{'Value': severity, 'Comparison': 'EQUALS'}]
-            
-            response = self.security_hub.get_findings(
-                Filters=filters,
-                MaxResults=limit,
-                SortCriteria=[
-                    {'Field': 'SeverityLabel', 'SortOrder': 'desc'}
-                ]
-            )
+            response = self.security_hub.get_findings(**params)
             
-            findings = []
-            for finding in response.get('Findings', []):
-                findings.append({
-                    'id': finding.get('Id', ''),
-                    'title': finding.get('Title', ''),
-                    'description': finding.get('Description', ''),
-                    'severity': finding.get('Severity', {}).get('Label', 'INFORMATIONAL'),
-                    'resource_type': finding.get('Resources', [{}])[0].get('Type', 'Unknown'),
-                    'resource_id': finding.get('Resources', [{}])[0].get('Id', 'Unknown'),
-                    'compliance_status': finding.get('Compliance', {}).get('Status', 'NOT_AVAILABLE'),
-                    'workflow_status': finding.get('Workflow', {}).get('Status', 'NEW'),
-                    'created_at': finding.get('CreatedAt', ''),
-                    'updated_at': finding.get('UpdatedAt', ''),
-                    'remediation': finding.get('Remediation', {}).get('Recommendation', {}).get('Text', '')
-                })
-            
-            return findings
+            return {
+                'findings': [self._finding_summary(f) for f in response.get('Findings', [])],
+                'next_token': response.get('NextToken')
+            }
         except Exception as e:
             st.error(f"Error listing findings: {str(e)}")
-            return []
+            return {'findings': [], 'next_token': None}
     
     def update_finding_workflow(self, finding_id: str, workflow_status: str) -> Dict[str, Any]:
         """Update the workflow status of a finding"""
@@ -256,7 +286,7 @@ class SecurityManager:
             st.error(f"Error listing Config rules: {str(e)}")
             return []
     
-    def get_compliance_summary(self) -> Dict[str, Any]:
+    def get_compliance_summary(self) -> ComplianceSummary:
         """Get Config compliance summary"""
         try:
             response = self.config.describe_compliance_by_config_rule()
@@ -273,15 +303,45 @@ class SecurityManager:
                 compliance_type = compliance.get('ComplianceType', 'INSUFFICIENT_DATA')
                 compliance_counts[compliance_type] = compliance_counts.get(compliance_type, 0) + 1
             
-            return {
-                'total_rules': sum(compliance_counts.values()),
-                'compliance_counts': compliance_counts,
-                'compliance_percentage': (compliance_counts['COMPLIANT'] / sum(compliance_counts.values()) * 100) if sum(compliance_counts.values()) > 0 else 0
-            }
+            total_rules = sum(compliance_counts.values())
+            return ComplianceSummary(
+                total_rules=total_rules,
+                compliant=compliance_counts['COMPLIANT'],
+                non_compliant=compliance_counts['NON_COMPLIANT'],
+                compliance_percentage=(compliance_counts['COMPLIANT'] / total_rules * 100) if total_rules > 0 else 0.0
+            )
         except Exception as e:
             st.error(f"Error getting compliance summary: {str(e)}")
-            return {'total_rules': 0, 'compliance_counts': {}}
+            return ComplianceSummary()
     
+    def get_aggregate_compliance(self, aggregator_name: str) -> List[Dict[str, Any]]:
+        """
+        Get compliance for every account and rule from an organization aggregator
+
+        Args:
+            aggregator_name: Name of the AWS Config configuration aggregator
+
+        Returns:
+            List of per account/rule compliance records
+
+        Raises:
+            ClientError / BotoCoreError if the aggregator query fails, so callers
+            can tell a failed query from an aggregator with no results
+        """
+        results = []
+        paginator = self.config.get_paginator('describe_aggregate_compliance_by_config_rules')
+
+        for page in paginator.paginate(ConfigurationAggregatorName=aggregator_name):
+            for item in page.get('AggregateComplianceByConfigRules', []):
+                results.append({
+                    'account_id': item.get('AccountId', ''),
+                    'region': item.get('AwsRegion', ''),
+                    'rule': item.get('ConfigRuleName', ''),
+                    'compliance_type': item.get('Compliance', {}).get('ComplianceType', 'INSUFFICIENT_DATA')
+                })
+
+        return results
+
     def get_non_compliant_resources(self, rule_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get non-compliant resources"""
         try:
@@ -392,7 +452,7 @@ class SecurityManager:
             score -= (total_findings - critical_findings - high_findings) * 0.5
             
             # Compliance bonus
-            compliance_pct = config_summary.get('compliance_percentage', 0)
+            compliance_pct = config_summary.compliance_percentage
             score = (score + compliance_pct) / 2
             
             score = max(0, min(100, score))  # Clamp between 0-100
@@ -4,16 +4,17 @@ Supports Parameter Store, Automation, Session Manager, and Patch Management
 """
 
 import streamlit as st
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 from core_account_manager import get_account_manager
+from config_settings import AppConfig
 
 class SystemsManagerManager:
     """AWS Systems Manager Management"""
     
     def __init__(self, session):
         """Initialize Systems Manager with boto3 session"""
-        self.ssm = session.client('ssm')
+        self.ssm = session.client('ssm', config=AppConfig.BOTO_CONFIG)
     
     # ============= PARAMETER STORE =============
     
@@ -197,6 +198,19 @@ class SystemsManagerManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    @staticmethod
+    def _execution_summary(execution: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten automation execution metadata into the fields the UI shows"""
+        end_time = execution.get('ExecutionEndTime')
+        return {
+            'execution_id': execution['AutomationExecutionId'],
+            'document_name': execution['DocumentName'],
+            'document_version': execution.get('DocumentVersion', ''),
+            'execution_start_time': execution.get('ExecutionStartTime', datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
+            'execution_end_time': end_time.strftime('%Y-%m-%d %H:%M:%S') if end_time else 'Running',
+            'status': execution.get('AutomationExecutionStatus', 'Unknown')
+        }
+    
     def describe_automation_executions(self, max_results: int = 50) -> List[Dict[str, Any]]:
         """List automation executions"""
         try:
@@ -204,22 +218,31 @@ class SystemsManagerManager:
                 MaxResults=max_results
             )
             
-            executions = []
-            for execution in response.get('AutomationExecutionMetadataList', []):
-                executions.append({
-                    'execution_id': execution['AutomationExecutionId'],
-                    'document_name': execution['DocumentName'],
-                    'document_version': execution.get('DocumentVersion', ''),
-                    'execution_start_time': execution.get('ExecutionStartTime', datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
-                    'execution_end_time': execution.get('ExecutionEndTime', datetime.now()).strftime('%Y-%m-%d %H:%M:%S') if execution.get('ExecutionEndTime') else 'Running',
-                    'status': execution.get('AutomationExecutionStatus', 'Unknown')
-                })
-            
-            return executions
+            return [
+                self._execution_summary(execution)
+                for execution in response.get('AutomationExecutionMetadataList', [])
+            ]
         except Exception as e:
             st.error(f"Error listing automation executions: {str(e)}")
             return []
     
+    def paginate_automation_executions(self, page_size: int = 10,
+                                       max_items: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield automation executions one page at a time as they arrive"""
+        try:
+            paginator = self.ssm.get_paginator('describe_automation_executions')
+            pagination_config = {'PageSize': page_size}
+            if max_items:
+                pagination_config['MaxItems'] = max_items
+            
+            for page in paginator.paginate(PaginationConfig=pagination_config):
+                yield [
+                    self._execution_summary(execution)
+                    for execution in page.get('AutomationExecutionMetadataList', [])
+                ]
+        except Exception as e:
+            st.error(f"Error listing automation executions: {str(e)}")
+    
     # ============= RUN COMMAND =============
     
     def send_command(self, document_name: str, instance_ids: List[str],
@@ -6,6 +6,7 @@ import streamlit as st
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 import json
+from botocore.config import Config
 
 @dataclass
 class AWSAccountConfig:
@@ -44,6 +45,13 @@ class AppConfig:
     CACHE_TTL_COSTS = 3600    # 1 hour
     CACHE_TTL_SECURITY = 300  # 5 minutes
     
+    # boto3 client settings shared by all service managers: adaptive retries absorb
+    # throttling (RequestLimitExceeded) and a larger pool lets thread-pool fan-out reuse connections
+    BOTO_CONFIG = Config(
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        max_pool_connections=50
+    )
+    
     # Pagination
     DEFAULT_PAGE_SIZE = 50
     MAX_PAGE_SIZE = 500
@@ -262,6 +262,92 @@ def get_account_manager() -> Optional[AWSAccountManager]:
     
     return AWSAccountManager(credentials)
 
+@st.cache_resource(ttl=3000, show_spinner=False)
+def _cached_assumed_session(account_id: str, account_name: str, role_arn: str) -> AssumedRoleSession:
+    """Assume a role once and reuse it (TTL is below the 1 hour STS credential lifetime)"""
+    account_mgr = get_account_manager()
+    assumed = account_mgr.assume_role(account_id, account_name, role_arn) if account_mgr else None
+    if assumed is None:
+        # Raise so that a failed assume-role is not cached
+        raise LookupError(f"Unable to assume role for account {account_name}")
+    return assumed
+
+def get_assumed_session(account_id: str, account_name: str, role_arn: str) -> Optional[AssumedRoleSession]:
+    """
+    Get a cached assumed-role session for an account
+    
+    Args:
+        account_id: Target AWS account ID
+        account_name: Friendly name for the account
+        role_arn: ARN of role to assume
+        
+    Returns:
+        AssumedRoleSession or None
+    """
+    try:
+        return _cached_assumed_session(account_id, account_name, role_arn)
+    except LookupError:
+        return None
+
+def _account_assumed_session(account_name: str) -> Optional[AssumedRoleSession]:
+    """Resolve a configured account by name and return its cached assumed-role session"""
+    from config_settings import AppConfig
+    
+    for account in AppConfig.load_aws_accounts():
+        if account.account_name == account_name:
+            return get_assumed_session(account.account_id, account.account_name, account.role_arn)
+    
+    return None
+
+def get_account_session(account_name: str) -> Optional[boto3.Session]:
+    """
+    Get a cached boto3 session for an account by name
+    
+    Args:
+        account_name: Name of the account
+        
+    Returns:
+        boto3.Session or None
+    """
+    assumed = _account_assumed_session(account_name)
+    return assumed.session if assumed else None
+
+@st.cache_resource(ttl=1800, show_spinner=False)
+def _cached_service_manager(_manager_cls: type, manager_name: str, account_name: str,
+                            session_expiration: datetime, _session: boto3.Session):
+    """Build a service manager once per assumed-role session"""
+    return _manager_cls(_session)
+
+def get_service_manager(manager_cls: type, account_name: str):
+    """
+    Get a cached service manager (EC2Service, SecurityManager, ...) for an account
+    
+    Managers are reused across reruns so their boto3 clients keep HTTPS
+    connections alive. They are keyed on the account's current assumed-role
+    session, so once that session is re-assumed (cache TTL or
+    clear_session_cache) callers get managers built on the new credentials.
+    
+    Args:
+        manager_cls: Manager class taking a boto3 session
+        account_name: Name of the account
+        
+    Returns:
+        Manager instance or None if no session is available
+    """
+    assumed = _account_assumed_session(account_name)
+    if assumed is None:
+        return None
+    
+    return _cached_service_manager(
+        manager_cls, f"{manager_cls.__module__}.{manager_cls.__qualname__}",
+        account_name, assumed.expiration, assumed.session
+    )
+
+def clear_session_cache():
+    """Drop cached sessions and the managers built on them so the next lookup assumes roles again"""
+    _cached_assumed_session.clear()
+    _cached_service_manager.clear()
+
 def get_account_names() -> List[str]:
     """
     Get list of configured AWS account names
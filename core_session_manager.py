@@ -6,6 +6,12 @@ import streamlit as st
 from typing import Any, Optional, List, Dict
 from datetime import datetime
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _active_account_count() -> int:
+    """Count active accounts in the secrets config; the footer asks on every rerun"""
+    from config_settings import AppConfig
+    return sum(1 for acc in AppConfig.load_aws_accounts() if acc.status == 'active')
+
 class SessionManager:
     """Centralized session state management"""
     
@@ -79,9 +85,7 @@ class SessionManager:
     @staticmethod
     def get_active_account_count() -> int:
         """Get count of active connected accounts"""
-        from config_settings import AppConfig
-        accounts = AppConfig.load_aws_accounts()
-        return len([acc for acc in accounts if acc.status == 'active'])
+        return _active_account_count()
     
     @staticmethod
     def trigger_refresh():
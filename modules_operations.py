@@ -4,10 +4,83 @@ Instance management, automation, scaling, and operational tasks
 """
 
 import streamlit as st
-import pandas as pd
-from core_account_manager import get_account_manager, get_account_names
-from aws_ec2 import EC2Service
-from aws_ssm import SystemsManagerManager
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from core_account_manager import get_account_manager, get_account_names, get_service_manager
+from utils_helpers import Helpers
+
+# pandas and the AWS service wrappers are imported where they are used,
+# so the tab costs nothing until an account is actually selected
+if TYPE_CHECKING:
+    from aws_ec2 import EC2Service
+    from aws_ssm import SystemsManagerManager
+
+# Instance state -> status icon (anything else is shown as transitional)
+_STATE_ICONS = {'running': '🟢', 'stopped': '🔴'}
+
+_INSTANCE_STATES = ['running', 'stopped', 'pending', 'terminated']
+_DEFAULT_INSTANCE_STATES = ('running', 'stopped')
+_INSTANCE_ACTIONS = ('start', 'stop', 'reboot', 'monitor', 'connect')
+
+@dataclass(frozen=True, slots=True)
+class AutoScalingGroup:
+    """Auto scaling group summary"""
+    name: str
+    desired: int
+    min_size: int
+    max_size: int
+    current: int
+    status: str
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceWindow:
+    """Maintenance window definition"""
+    name: str
+    schedule: str
+    duration: str
+    enabled: bool
+
+# Sample auto scaling groups
+_ASG_DATA = (
+    AutoScalingGroup("web-servers-asg", desired=4, min_size=2, max_size=10, current=4, status="Healthy"),
+    AutoScalingGroup("api-servers-asg", desired=6, min_size=3, max_size=15, current=6, status="Healthy"),
+    AutoScalingGroup("worker-nodes-asg", desired=2, min_size=1, max_size=5, current=2, status="Healthy")
+)
+
+# Maintenance windows
+_MAINTENANCE_WINDOWS = (
+    MaintenanceWindow("Weekly Patching", "Every Sunday 2:00 AM UTC", "4 hours", True),
+    MaintenanceWindow("Monthly AMI Creation", "First Sunday 1:00 AM UTC", "2 hours", True),
+    MaintenanceWindow("Quarterly DR Test", "First Saturday of Quarter", "8 hours", False)
+)
+
+def _get_managers(account: str) -> Tuple[Optional['EC2Service'], Optional['SystemsManagerManager']]:
+    """EC2 and SSM managers for an account, importing the AWS wrappers on first use"""
+    from aws_ec2 import EC2Service
+    from aws_ssm import SystemsManagerManager
+    
+    return get_service_manager(EC2Service, account), get_service_manager(SystemsManagerManager, account)
+
+class InstanceListError(Exception):
+    """EC2Service reported a failed instance listing (throttling, AccessDenied, ...)"""
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_instances(_ec2_svc: 'EC2Service', account: str, states: Tuple[str, ...]) -> Dict:
+    """
+    List instances for an account, cached per state filter
+    
+    Each instance also gets its expander label and per-action widget keys here,
+    so they are built once per fetch rather than on every rerun. A failed
+    listing raises InstanceListError so it is not cached.
+    """
+    result = _ec2_svc.list_instances(state_filter=list(states))
+    if not result['success']:
+        raise InstanceListError(result['error'])
+    for i in result.get('instances', []):
+        i['label'] = f"{_STATE_ICONS.get(i['state'], '🟡')} {i['name']} ({i['instance_id']})"
+        i['widget_keys'] = {action: f"{action}_{i['instance_id']}" for action in _INSTANCE_ACTIONS}
+    return result
 
 class OperationsModule:
     """Operations & Automation functionality"""
@@ -40,13 +113,26 @@ class OperationsModule:
         if not selected_account:
             return
         
-        session = account_mgr.get_session(selected_account)
-        if not session:
+        ec2_svc, ssm_mgr = _get_managers(selected_account)
+        if not ec2_svc or not ssm_mgr:
             st.error("Failed to get session")
             return
         
-        ec2_svc = EC2Service(session)
-        ssm_mgr = SystemsManagerManager(session)
+        # Fire the independent AWS calls concurrently; each tab waits on its own result
+        executor = Helpers.thread_pool(max_workers=8)
+        instance_states = tuple(st.session_state.get('ops_instance_states', _DEFAULT_INSTANCE_STATES))
+        # An empty state selection means nothing to list (no filter would return every state)
+        instances_future = (
+            executor.submit(_list_instances, ec2_svc, selected_account, instance_states)
+            if instance_states else None
+        )
+        documents_future = executor.submit(
+            ssm_mgr.list_documents,
+            document_filter_list=[{'Key': 'Owner', 'Values': ['Self', 'Amazon']}]
+        )
+        baselines_future = executor.submit(ssm_mgr.describe_patch_baselines)
+        patches_future = executor.submit(ssm_mgr.describe_available_patches, max_results=20)
+        executor.shutdown(wait=False)
         
         # Create tabs
         tabs = st.tabs([
@@ -58,10 +144,10 @@ class OperationsModule:
         ])
         
         with tabs[0]:
-            OperationsModule._render_instance_ops(ec2_svc)
+            OperationsModule._render_instance_ops(ec2_svc, selected_account, instances_future)
         
         with tabs[1]:
-            OperationsModule._render_automation(ssm_mgr)
+            OperationsModule._render_automation(ssm_mgr, documents_future)
         
         with tabs[2]:
             OperationsModule._render_scaling()
@@ -70,15 +156,34 @@ class OperationsModule:
             OperationsModule._render_maintenance(ssm_mgr)
         
         with tabs[4]:
-            OperationsModule._render_patch_management(ssm_mgr)
+            OperationsModule._render_patch_management(baselines_future, patches_future)
     
     @staticmethod
-    def _render_instance_ops(ec2_svc: EC2Service):
+    @st.fragment
+    def _render_instance_ops(ec2_svc: 'EC2Service', account: str, instances_future: Optional[Future]):
         """Instance operations"""
         st.subheader("💻 Instance Operations")
         
-        # List instances
-        instances = ec2_svc.list_instances()
+        states = st.multiselect(
+            "States",
+            options=_INSTANCE_STATES,
+            default=list(_DEFAULT_INSTANCE_STATES),
+            key="ops_instance_states"
+        )
+        
+        if not states:
+            st.info("Select at least one instance state")
+            return
+        
+        # Wait for the prefetch, then read through the cache so a changed
+        # state filter only fetches the new combination
+        try:
+            if instances_future:
+                instances_future.result()
+            instances = _list_instances(ec2_svc, account, tuple(states)).get('instances', [])
+        except InstanceListError as e:
+            st.error(f"Error listing instances: {e}")
+            return
         
         if not instances:
             st.info("No EC2 instances found")
@@ -117,9 +222,8 @@ class OperationsModule:
         st.markdown("### Instance List")
         
         for instance in instances:
-            status_icon = "🟢" if instance['state'] == "running" else "🔴" if instance['state'] == "stopped" else "🟡"
-            
-            with st.expander(f"{status_icon} {instance['name']} ({instance['instance_id']})"):
+            keys = instance['widget_keys']
+            with st.expander(instance['label']):
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
@@ -140,33 +244,34 @@ class OperationsModule:
                 
                 with col1:
                     if instance['state'] == 'stopped':
-                        if st.button("▶️ Start", key=f"start_{instance['instance_id']}"):
+                        if st.button("▶️ Start", key=keys['start']):
                             st.success("Instance starting...")
                     elif instance['state'] == 'running':
-                        if st.button("⏸️ Stop", key=f"stop_{instance['instance_id']}"):
+                        if st.button("⏸️ Stop", key=keys['stop']):
                             st.warning("Instance stopping...")
                 
                 with col2:
-                    if st.button("🔄 Reboot", key=f"reboot_{instance['instance_id']}"):
+                    if st.button("🔄 Reboot", key=keys['reboot']):
                         st.info("Instance rebooting...")
                 
                 with col3:
-                    if st.button("📊 Monitor", key=f"monitor_{instance['instance_id']}"):
+                    if st.button("📊 Monitor", key=keys['monitor']):
                         st.info("Opening CloudWatch metrics...")
                 
                 with col4:
-                    if st.button("🔗 Connect", key=f"connect_{instance['instance_id']}"):
+                    if st.button("🔗 Connect", key=keys['connect']):
                         st.info("Opening Session Manager...")
     
     @staticmethod
-    def _render_automation(ssm_mgr: SystemsManagerManager):
+    @st.fragment
+    def _render_automation(ssm_mgr: 'SystemsManagerManager', documents_future: Future):
         """Automation workflows"""
+        import pandas as pd
+        
         st.subheader("🔄 Automation Workflows")
         
         # List automation documents
-        documents = ssm_mgr.list_documents(
-            document_filter_list=[{'Key': 'Owner', 'Values': ['Self', 'Amazon']}]
-        )
+        documents = documents_future.result()
         
         if documents:
             st.metric("Available Automation Documents", len(documents))
@@ -196,19 +301,25 @@ class OperationsModule:
                 if st.button("📊 Generate Compliance Report"):
                     st.success("Automation initiated: Compliance report")
             
-            # Recent automation executions
+            # Recent automation executions - rendered page by page as SSM returns them
             st.markdown("### Recent Executions")
             
-            executions = ssm_mgr.describe_automation_executions(max_results=10)
+            placeholder = st.empty()
+            executions = []
             
-            if executions:
-                exec_df = pd.DataFrame(executions)
-                st.dataframe(exec_df[['execution_id', 'document_name', 'status']], 
-                           use_container_width=True)
+            with st.status("Loading executions...", expanded=False) as status:
+                for page in ssm_mgr.paginate_automation_executions(page_size=5, max_items=10):
+                    executions.extend(page)
+                    if executions:
+                        exec_df = pd.DataFrame(executions)
+                        placeholder.dataframe(exec_df[['execution_id', 'document_name', 'status']], 
+                                              use_container_width=True)
+                status.update(label=f"Loaded {len(executions)} execution(s)", state="complete")
         else:
             st.info("No automation documents available")
     
     @staticmethod
+    @st.fragment
     def _render_scaling():
         """Scaling operations"""
         st.subheader("📊 Auto Scaling")
@@ -219,46 +330,40 @@ class OperationsModule:
         Configure and monitor auto scaling for your applications.
         """)
         
-        # Sample auto scaling groups
-        asg_data = [
-            {"Name": "web-servers-asg", "Desired": 4, "Min": 2, "Max": 10, "Current": 4, "Status": "Healthy"},
-            {"Name": "api-servers-asg", "Desired": 6, "Min": 3, "Max": 15, "Current": 6, "Status": "Healthy"},
-            {"Name": "worker-nodes-asg", "Desired": 2, "Min": 1, "Max": 5, "Current": 2, "Status": "Healthy"}
-        ]
-        
-        for asg in asg_data:
-            with st.expander(f"📊 {asg['Name']} - {asg['Status']}"):
+        for asg in _ASG_DATA:
+            with st.expander(f"📊 {asg.name} - {asg.status}"):
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    st.metric("Desired", asg['Desired'])
+                    st.metric("Desired", asg.desired)
                 with col2:
-                    st.metric("Current", asg['Current'])
+                    st.metric("Current", asg.current)
                 with col3:
-                    st.metric("Min", asg['Min'])
+                    st.metric("Min", asg.min_size)
                 with col4:
-                    st.metric("Max", asg['Max'])
+                    st.metric("Max", asg.max_size)
                 
                 # Scaling actions
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
                     new_desired = st.number_input(f"Set Desired Capacity",
-                                                 min_value=asg['Min'],
-                                                 max_value=asg['Max'],
-                                                 value=asg['Desired'],
-                                                 key=f"desired_{asg['Name']}")
+                                                 min_value=asg.min_size,
+                                                 max_value=asg.max_size,
+                                                 value=asg.desired,
+                                                 key=f"desired_{asg.name}")
                 
                 with col2:
-                    if st.button("Apply", key=f"apply_{asg['Name']}"):
-                        st.success(f"Scaling {asg['Name']} to {new_desired} instances")
+                    if st.button("Apply", key=f"apply_{asg.name}"):
+                        st.success(f"Scaling {asg.name} to {new_desired} instances")
                 
                 with col3:
-                    if st.button("Refresh", key=f"refresh_{asg['Name']}"):
+                    if st.button("Refresh", key=f"refresh_{asg.name}"):
                         st.info("Refreshing...")
     
     @staticmethod
-    def _render_maintenance(ssm_mgr: SystemsManagerManager):
+    @st.fragment
+    def _render_maintenance(ssm_mgr: 'SystemsManagerManager'):
         """Maintenance windows"""
         st.subheader("🔧 Maintenance Windows")
         
@@ -268,36 +373,32 @@ class OperationsModule:
         Define maintenance windows for automated tasks and updates.
         """)
         
-        # Maintenance windows
-        maintenance_windows = [
-            {"Name": "Weekly Patching", "Schedule": "Every Sunday 2:00 AM UTC", "Duration": "4 hours", "Enabled": True},
-            {"Name": "Monthly AMI Creation", "Schedule": "First Sunday 1:00 AM UTC", "Duration": "2 hours", "Enabled": True},
-            {"Name": "Quarterly DR Test", "Schedule": "First Saturday of Quarter", "Duration": "8 hours", "Enabled": False}
-        ]
-        
-        for mw in maintenance_windows:
-            status_icon = "✅" if mw['Enabled'] else "⏸️"
+        for mw in _MAINTENANCE_WINDOWS:
+            status_icon = "✅" if mw.enabled else "⏸️"
             
-            with st.expander(f"{status_icon} {mw['Name']}"):
+            with st.expander(f"{status_icon} {mw.name}"):
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    st.write(f"**Schedule:** {mw['Schedule']}")
-                    st.write(f"**Duration:** {mw['Duration']}")
+                    st.write(f"**Schedule:** {mw.schedule}")
+                    st.write(f"**Duration:** {mw.duration}")
                 
                 with col2:
-                    st.write(f"**Status:** {'Enabled' if mw['Enabled'] else 'Disabled'}")
+                    st.write(f"**Status:** {'Enabled' if mw.enabled else 'Disabled'}")
                 
-                if st.button("Edit", key=f"edit_{mw['Name']}"):
-                    st.info(f"Editing {mw['Name']}")
+                if st.button("Edit", key=f"edit_{mw.name}"):
+                    st.info(f"Editing {mw.name}")
     
     @staticmethod
-    def _render_patch_management(ssm_mgr: SystemsManagerManager):
+    @st.fragment
+    def _render_patch_management(baselines_future: Future, patches_future: Future):
         """Patch management"""
+        import pandas as pd
+        
         st.subheader("📦 Patch Management")
         
         # Patch baselines
-        baselines = ssm_mgr.describe_patch_baselines()
+        baselines = baselines_future.result()
         
         if baselines:
             st.metric("Patch Baselines", len(baselines))
@@ -309,7 +410,7 @@ class OperationsModule:
         # Available patches
         st.markdown("### Available Patches")
         
-        patches = ssm_mgr.describe_available_patches(max_results=20)
+        patches = patches_future.result()
         
         if patches:
             st.write(f"**Available Patches:** {len(patches)}")
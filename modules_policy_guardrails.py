@@ -4,9 +4,151 @@ SCP policies, tag policies, and guardrail enforcement
 """
 
 import streamlit as st
-import pandas as pd
-from core_account_manager import get_account_manager, get_account_names
-from aws_organizations import AWSOrganizationsManager
+import json
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from botocore.exceptions import BotoCoreError, ClientError
+from core_account_manager import get_account_manager, get_account_names, get_service_manager
+from utils_helpers import Helpers
+
+# pandas and the AWS service wrappers are imported where they are used,
+# so the tab costs nothing until a management account is actually selected
+if TYPE_CHECKING:
+    import pandas as pd
+    from aws_organizations import AWSOrganizationsManager
+    from aws_security import SecurityManager
+
+# Icon lookups for guardrail and compliance rows
+_SEVERITY_ICONS = {'High': '🔴', 'Medium': '🟡', 'Low': '🟢'}
+_STATUS_ICONS = {'Enabled': '✅'}
+
+@dataclass(frozen=True, slots=True)
+class PreventiveGuardrail:
+    """Preventive guardrail definition"""
+    name: str
+    status: str
+    severity: str
+
+@dataclass(frozen=True, slots=True)
+class DetectiveGuardrail:
+    """Detective guardrail with open finding count"""
+    name: str
+    status: str
+    findings: int
+
+@dataclass(frozen=True, slots=True)
+class NonCompliantAccount:
+    """Account with outstanding policy violations"""
+    account: str
+    violations: int
+    severity: str
+
+_PREVENTIVE_GUARDRAILS = (
+    PreventiveGuardrail("Deny Root Account Usage", "Enabled", "High"),
+    PreventiveGuardrail("Require MFA for IAM Users", "Enabled", "High"),
+    PreventiveGuardrail("Deny Public S3 Buckets", "Enabled", "High"),
+    PreventiveGuardrail("Restrict Region Usage", "Enabled", "Medium"),
+    PreventiveGuardrail("Deny Unencrypted EBS Volumes", "Enabled", "High")
+)
+
+_DETECTIVE_GUARDRAILS = (
+    DetectiveGuardrail("Detect Unused IAM Credentials", "Enabled", 3),
+    DetectiveGuardrail("Detect Open Security Groups", "Enabled", 5),
+    DetectiveGuardrail("Detect Unencrypted Resources", "Enabled", 12),
+    DetectiveGuardrail("Detect Public RDS Instances", "Enabled", 0)
+)
+
+# Compliance by policy (rows follow _POLICY_COMPLIANCE_COLUMNS)
+_POLICY_COMPLIANCE_COLUMNS = ("Policy", "Compliant", "Non-Compliant", "Status")
+_POLICY_COMPLIANCE = (
+    ("Require MFA", 45, 3, "95%"),
+    ("No Public S3", 42, 6, "88%"),
+    ("Encryption Required", 40, 8, "83%"),
+    ("Tagging Standard", 38, 10, "79%")
+)
+
+_NON_COMPLIANT_ACCOUNTS = (
+    NonCompliantAccount("dev-account-01", 5, "Medium"),
+    NonCompliantAccount("test-account-03", 3, "Low"),
+    NonCompliantAccount("sandbox-account-02", 8, "High")
+)
+
+_POLICY_COLUMNS = ['id', 'arn', 'name', 'description', 'type', 'aws_managed']
+_AGGREGATE_COLUMNS = ['account_id', 'region', 'rule', 'compliance_type']
+
+_SCP_VERSIONS = ('2012-10-17', '2008-10-17')
+_SCP_EFFECTS = ('Allow', 'Deny')
+
+def _validate_scp(policy_json) -> Optional[str]:
+    """Check SCP structure before calling AWS; returns an error message or None"""
+    if not isinstance(policy_json, dict):
+        return "Policy document must be a JSON object"
+    if policy_json.get('Version') not in _SCP_VERSIONS:
+        return f"Version must be one of: {', '.join(_SCP_VERSIONS)}"
+    
+    statements = policy_json.get('Statement')
+    if isinstance(statements, dict):
+        statements = [statements]
+    if not isinstance(statements, list) or not statements:
+        return "Statement must be a non-empty list"
+    
+    for i, statement in enumerate(statements):
+        if not isinstance(statement, dict):
+            return f"Statement {i} must be a JSON object"
+        if statement.get('Effect') not in _SCP_EFFECTS:
+            return f"Statement {i}: Effect must be Allow or Deny"
+        if 'Action' not in statement and 'NotAction' not in statement:
+            return f"Statement {i}: Action or NotAction is required"
+    
+    return None
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _org_compliance(_sec_mgr: 'SecurityManager', account: str, aggregator_name: str) -> 'pd.DataFrame':
+    """Organization-wide rule compliance from one aggregator query, indexed by (account, rule)"""
+    import pandas as pd
+    
+    records = _sec_mgr.get_aggregate_compliance(aggregator_name)
+    return pd.DataFrame(records, columns=_AGGREGATE_COLUMNS).set_index(['account_id', 'rule'])
+
+def _run_for_targets(action: Callable[[str, str], Dict[str, Any]], policy_id: str,
+                     targets_text: str) -> List[Dict[str, str]]:
+    """Run an attach/detach call for every target (one per line) concurrently"""
+    targets = list(dict.fromkeys(t.strip() for t in targets_text.splitlines() if t.strip()))
+    
+    # AttachPolicy/DetachPolicy take one target per call; the calls are independent
+    with Helpers.thread_pool(max_workers=10) as executor:
+        results = list(executor.map(lambda target: action(policy_id, target), targets))
+    
+    return [
+        {
+            'Target': target,
+            'Status': '✅ Success' if result.get('success') else '❌ Failed',
+            'Detail': result.get('message') or result.get('error', '')
+        }
+        for target, result in zip(targets, results)
+    ]
+
+def _severity_for(violations: int) -> str:
+    """Map a violation count to a severity label"""
+    if violations >= 5:
+        return 'High'
+    if violations >= 2:
+        return 'Medium'
+    return 'Low'
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _list_policies(_org_mgr: 'AWSOrganizationsManager', account: str) -> 'pd.DataFrame':
+    """List SCPs for an account as a DataFrame"""
+    import pandas as pd
+    
+    policies = _org_mgr.list_policies(policy_type='SERVICE_CONTROL_POLICY')
+    return pd.DataFrame(policies, columns=_POLICY_COLUMNS)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _list_accounts(_org_mgr: 'AWSOrganizationsManager', account: str) -> List[Dict]:
+    """List organization accounts; membership changes rarely, so cache for 10 minutes"""
+    return _org_mgr.list_accounts()
 
 class PolicyGuardrailsModule:
     """Policy & Guardrails Management"""
@@ -41,12 +183,18 @@ class PolicyGuardrailsModule:
         if not selected_account:
             return
         
-        session = account_mgr.get_session(selected_account)
-        if not session:
+        from aws_organizations import AWSOrganizationsManager
+        
+        org_mgr = get_service_manager(AWSOrganizationsManager, selected_account)
+        if not org_mgr:
             st.error("Failed to get session")
             return
         
-        org_mgr = AWSOrganizationsManager(session)
+        # Prefetch the policy list and org accounts in the background while the tabs render
+        executor = Helpers.thread_pool(max_workers=8)
+        policies_future = executor.submit(_list_policies, org_mgr, selected_account)
+        accounts_future = executor.submit(_list_accounts, org_mgr, selected_account)
+        executor.shutdown(wait=False)
         
         # Create tabs
         tabs = st.tabs([
@@ -57,7 +205,7 @@ class PolicyGuardrailsModule:
         ])
         
         with tabs[0]:
-            PolicyGuardrailsModule._render_scp_policies(org_mgr)
+            PolicyGuardrailsModule._render_scp_policies(org_mgr, selected_account, policies_future)
         
         with tabs[1]:
             PolicyGuardrailsModule._render_tag_policies()
@@ -66,60 +214,70 @@ class PolicyGuardrailsModule:
             PolicyGuardrailsModule._render_guardrails()
         
         with tabs[3]:
-            PolicyGuardrailsModule._render_compliance(org_mgr)
+            PolicyGuardrailsModule._render_compliance(selected_account, accounts_future)
     
     @staticmethod
-    def _render_scp_policies(org_mgr: AWSOrganizationsManager):
+    @st.fragment
+    def _render_scp_policies(org_mgr: 'AWSOrganizationsManager', account: str, policies_future: Future):
         """SCP policy management"""
         st.subheader("📜 Service Control Policies (SCPs)")
         
-        # List policies
-        policies = org_mgr.list_policies(policy_type='SERVICE_CONTROL_POLICY')
+        if st.button("🔄 Refresh Policies", key="policy_refresh_scps"):
+            _list_policies.clear()
+            st.rerun()
+        
+        # Reported here because creating a policy reruns the fragment to refresh the list
+        created_policy_id = st.session_state.pop('policy_created_scp', None)
+        if created_policy_id:
+            st.success(f"✅ Policy created: {created_policy_id}")
         
-        if policies:
-            st.metric("Total SCPs", len(policies))
+        # Wait for the prefetch, then read through the cache so a fragment
+        # rerun after a create or refresh sees the current list
+        policies_future.result()
+        policies_df = _list_policies(org_mgr, account)
+        
+        if not policies_df.empty:
+            st.metric("Total SCPs", len(policies_df))
             
             # Filter
             show_aws_managed = st.checkbox("Show AWS Managed Policies", value=False)
             
-            filtered_policies = [p for p in policies if not p['aws_managed']] if not show_aws_managed else policies
+            filtered_df = policies_df if show_aws_managed else policies_df[~policies_df['aws_managed']]
             
             # Display policies
-            for policy in filtered_policies:
-                managed_badge = "🔒 AWS Managed" if policy['aws_managed'] else "📝 Custom"
+            for policy in filtered_df.itertuples(index=False):
+                managed_badge = "🔒 AWS Managed" if policy.aws_managed else "📝 Custom"
                 
-                with st.expander(f"{managed_badge} {policy['name']}"):
-                    st.write(f"**Description:** {policy.get('description', 'No description')}")
-                    st.write(f"**Type:** {policy['type']}")
-                    st.write(f"**Policy ID:** {policy['id']}")
+                with st.expander(f"{managed_badge} {policy.name}"):
+                    st.write(f"**Description:** {policy.description or 'No description'}")
+                    st.write(f"**Type:** {policy.type}")
+                    st.write(f"**Policy ID:** {policy.id}")
                     
                     # Get policy content
-                    if st.button("View Policy Document", key=f"view_{policy['id']}"):
-                        content = org_mgr.get_policy_content(policy['id'])
+                    if st.button("View Policy Document", key=f"view_{policy.id}"):
+                        content = org_mgr.get_policy_content(policy.id)
                         if content:
                             st.json(content)
                     
                     # Attach/Detach
-                    if not policy['aws_managed']:
+                    if not policy.aws_managed:
                         col1, col2 = st.columns(2)
                         
                         with col1:
-                            target_attach = st.text_input(f"Attach to (Account/OU ID)", 
-                                                         key=f"attach_{policy['id']}")
-                            if st.button("Attach", key=f"attach_btn_{policy['id']}"):
-                                if target_attach:
-                                    result = org_mgr.attach_policy(policy['id'], target_attach)
-                                    if result.get('success'):
-                                        st.success(f"✅ Policy attached")
+                            target_attach = st.text_area("Attach to (Account/OU IDs, one per line)",
+                                                         key=f"attach_{policy.id}")
+                            if st.button("Attach", key=f"attach_btn_{policy.id}"):
+                                if target_attach.strip():
+                                    results = _run_for_targets(org_mgr.attach_policy, policy.id, target_attach)
+                                    st.dataframe(results, use_container_width=True, hide_index=True)
                         
                         with col2:
-                            target_detach = st.text_input(f"Detach from (Account/OU ID)", 
-                                                         key=f"detach_{policy['id']}")
-                            if st.button("Detach", key=f"detach_btn_{policy['id']}"):
-                                if target_detach:
-                                    result = org_mgr.detach_policy(policy['id'], target_detach)
-                                    if result.get('success'):
-                                        st.success(f"✅ Policy detached")
+                            target_detach = st.text_area("Detach from (Account/OU IDs, one per line)",
+                                                         key=f"detach_{policy.id}")
+                            if st.button("Detach", key=f"detach_btn_{policy.id}"):
+                                if target_detach.strip():
+                                    results = _run_for_targets(org_mgr.detach_policy, policy.id, target_detach)
+                                    st.dataframe(results, use_container_width=True, hide_index=True)
         
         # Create new policy
         st.markdown("### Create New SCP")
@@ -138,9 +296,13 @@ class PolicyGuardrailsModule:
                 
                 if st.form_submit_button("Create Policy"):
                     if policy_name and policy_document:
-                        import json
                         try:
                             policy_json = json.loads(policy_document)
+                            validation_error = _validate_scp(policy_json)
+                            if validation_error:
+                                st.error(f"❌ {validation_error}")
+                                return
+                            
                             result = org_mgr.create_policy(
                                 name=policy_name,
                                 description=policy_description,
@@ -149,7 +311,9 @@ class PolicyGuardrailsModule:
                             )
                             
                             if result.get('success'):
-                                st.success(f"✅ Policy created: {result.get('policy_id')}")
+                                _list_policies.clear()
+                                st.session_state['policy_created_scp'] = result.get('policy_id')
+                                st.rerun(scope="fragment")
                             else:
                                 st.error(f"❌ {result.get('error')}")
                         except json.JSONDecodeError:
@@ -160,6 +324,8 @@ class PolicyGuardrailsModule:
     @staticmethod
     def _render_tag_policies():
         """Tag policy management"""
+        import pandas as pd
+        
         st.subheader("🏷️ Tag Policies")
         
         st.markdown("""
@@ -225,70 +391,118 @@ class PolicyGuardrailsModule:
         with guardrail_tabs[0]:
             st.markdown("### Preventive Guardrails")
             
-            preventive_guardrails = [
-                {"Name": "Deny Root Account Usage", "Status": "Enabled", "Severity": "High"},
-                {"Name": "Require MFA for IAM Users", "Status": "Enabled", "Severity": "High"},
-                {"Name": "Deny Public S3 Buckets", "Status": "Enabled", "Severity": "High"},
-                {"Name": "Restrict Region Usage", "Status": "Enabled", "Severity": "Medium"},
-                {"Name": "Deny Unencrypted EBS Volumes", "Status": "Enabled", "Severity": "High"}
-            ]
-            
-            for gr in preventive_guardrails:
-                severity_icon = "🔴" if gr['Severity'] == "High" else "🟡"
-                status_icon = "✅" if gr['Status'] == "Enabled" else "⏸️"
-                
+            for gr in _PREVENTIVE_GUARDRAILS:
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 
                 with col1:
-                    st.write(f"{severity_icon} {gr['Name']}")
+                    st.write(f"{_SEVERITY_ICONS.get(gr.severity, '🟡')} {gr.name}")
                 with col2:
-                    st.write(gr['Severity'])
+                    st.write(gr.severity)
                 with col3:
-                    st.write(f"{status_icon} {gr['Status']}")
+                    st.write(f"{_STATUS_ICONS.get(gr.status, '⏸️')} {gr.status}")
                 with col4:
-                    if st.button("Edit", key=f"edit_{gr['Name']}"):
-                        st.info(f"Editing {gr['Name']}")
+                    if st.button("Edit", key=f"edit_{gr.name}"):
+                        st.info(f"Editing {gr.name}")
         
         with guardrail_tabs[1]:
             st.markdown("### Detective Guardrails")
             
-            detective_guardrails = [
-                {"Name": "Detect Unused IAM Credentials", "Status": "Enabled", "Findings": 3},
-                {"Name": "Detect Open Security Groups", "Status": "Enabled", "Findings": 5},
-                {"Name": "Detect Unencrypted Resources", "Status": "Enabled", "Findings": 12},
-                {"Name": "Detect Public RDS Instances", "Status": "Enabled", "Findings": 0}
-            ]
-            
-            for gr in detective_guardrails:
-                finding_icon = "🔴" if gr['Findings'] > 0 else "🟢"
+            for gr in _DETECTIVE_GUARDRAILS:
+                finding_icon = "🔴" if gr.findings > 0 else "🟢"
                 
                 col1, col2, col3 = st.columns([3, 1, 2])
                 
                 with col1:
-                    st.write(f"{finding_icon} {gr['Name']}")
+                    st.write(f"{finding_icon} {gr.name}")
                 with col2:
-                    st.metric("Findings", gr['Findings'])
+                    st.metric("Findings", gr.findings)
                 with col3:
-                    if gr['Findings'] > 0:
-                        if st.button("View Findings", key=f"view_{gr['Name']}"):
-                            st.info(f"Viewing findings for {gr['Name']}")
+                    if gr.findings > 0:
+                        if st.button("View Findings", key=f"view_{gr.name}"):
+                            st.info(f"Viewing findings for {gr.name}")
     
     @staticmethod
-    def _render_compliance(org_mgr: AWSOrganizationsManager):
+    @st.fragment
+    def _render_compliance(selected_account: str, accounts_future: Future):
         """Policy compliance"""
+        import pandas as pd
+        
         st.subheader("📊 Policy Compliance Dashboard")
         
+        if st.button("🔄 Refresh Accounts", key="policy_refresh_accounts"):
+            _list_accounts.clear()
+            _org_compliance.clear()
+            st.rerun()
+        
+        aggregator_name = st.text_input(
+            "AWS Config Aggregator",
+            key="policy_config_aggregator",
+            help="Organization aggregator used to fetch compliance for all accounts in one query"
+        )
+        
         # Get compliance metrics
-        accounts = org_mgr.list_accounts()
+        accounts = accounts_future.result()
         
         if accounts:
+            compliance = None
+            if aggregator_name:
+                from aws_security import SecurityManager
+                
+                sec_mgr = get_service_manager(SecurityManager, selected_account)
+                if not sec_mgr:
+                    st.error("Failed to get session")
+                    return
+                
+                # A failed query raises, so it is neither cached nor shown as "all compliant"
+                try:
+                    compliance = _org_compliance(sec_mgr, selected_account, aggregator_name)
+                except (ClientError, BotoCoreError) as e:
+                    st.error(f"Error getting aggregate compliance: {e}")
+                    return
+                
+                if compliance.empty:
+                    st.info(f"No compliance results from aggregator {aggregator_name}")
+                    return
+            
+            if compliance is not None:
+                # Rules x compliance type counts across every account
+                counts = (
+                    compliance.groupby(level='rule')['compliance_type']
+                    .value_counts()
+                    .unstack(fill_value=0)
+                    .reindex(columns=['COMPLIANT', 'NON_COMPLIANT'], fill_value=0)
+                )
+                evaluated = (counts['COMPLIANT'] + counts['NON_COMPLIANT']).where(lambda n: n > 0, 1)
+                compliance_df = pd.DataFrame({
+                    'Policy': counts.index,
+                    'Compliant': counts['COMPLIANT'].values,
+                    'Non-Compliant': counts['NON_COMPLIANT'].values,
+                    'Status': (counts['COMPLIANT'] / evaluated * 100).map('{:.0f}%'.format).values
+                })
+                
+                account_names = {acc['id']: acc['name'] for acc in accounts}
+                violations = (
+                    compliance[compliance['compliance_type'] == 'NON_COMPLIANT']
+                    .groupby(level='account_id')
+                    .size()
+                    .sort_values(ascending=False)
+                )
+                non_compliant_accounts = [
+                    NonCompliantAccount(account_names.get(account_id, account_id), int(count), _severity_for(count))
+                    for account_id, count in violations.items()
+                ]
+            else:
+                st.caption("Showing sample data; enter an aggregator name to load live compliance")
+                compliance_df = pd.DataFrame(list(_POLICY_COMPLIANCE), columns=list(_POLICY_COMPLIANCE_COLUMNS))
+                non_compliant_accounts = list(_NON_COMPLIANT_ACCOUNTS)
+            
             # Compliance metrics
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
                 st.metric("Total Accounts", len(accounts))
             with col2:
-                compliant = int(len(accounts) * 0.85)
+                compliant = max(len(accounts) - len(non_compliant_accounts), 0)
                 st.metric("Compliant", compliant)
             with col3:
                 non_compliant = len(accounts) - compliant
@@ -300,31 +514,15 @@ class PolicyGuardrailsModule:
             # Compliance by policy
             st.markdown("### Compliance by Policy")
             
-            compliance_data = [
-                {"Policy": "Require MFA", "Compliant": 45, "Non-Compliant": 3, "Status": "95%"},
-                {"Policy": "No Public S3", "Compliant": 42, "Non-Compliant": 6, "Status": "88%"},
-                {"Policy": "Encryption Required", "Compliant": 40, "Non-Compliant": 8, "Status": "83%"},
-                {"Policy": "Tagging Standard", "Compliant": 38, "Non-Compliant": 10, "Status": "79%"}
-            ]
-            
-            compliance_df = pd.DataFrame(compliance_data)
             st.dataframe(compliance_df, use_container_width=True)
             
             # Non-compliant accounts
             st.markdown("### Non-Compliant Accounts")
             
-            non_compliant_accounts = [
-                {"Account": "dev-account-01", "Policy Violations": 5, "Severity": "Medium"},
-                {"Account": "test-account-03", "Policy Violations": 3, "Severity": "Low"},
-                {"Account": "sandbox-account-02", "Policy Violations": 8, "Severity": "High"}
-            ]
-            
             for acc in non_compliant_accounts:
-                severity_icon = "🔴" if acc['Severity'] == "High" else "🟡" if acc['Severity'] == "Medium" else "🟢"
-                
-                with st.expander(f"{severity_icon} {acc['Account']} - {acc['Policy Violations']} violations"):
-                    st.write(f"**Severity:** {acc['Severity']}")
-                    st.write(f"**Violations:** {acc['Policy Violations']}")
+                with st.expander(f"{_SEVERITY_ICONS.get(acc.severity, '🟢')} {acc.account} - {acc.violations} violations"):
+                    st.write(f"**Severity:** {acc.severity}")
+                    st.write(f"**Violations:** {acc.violations}")
                     
-                    if st.button("Remediate", key=f"remediate_{acc['Account']}"):
-                        st.success(f"Remediation initiated for {acc['Account']}")
+                    if st.button("Remediate", key=f"remediate_{acc.account}"):
+                        st.success(f"Remediation initiated for {acc.account}")
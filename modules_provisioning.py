@@ -5,9 +5,78 @@ Automated deployment workflows using CloudFormation, multi-region, rollback
 
 import streamlit as st
 import pandas as pd
+import json
+from concurrent.futures import as_completed
 from typing import Dict, List, Optional
-from core_account_manager import get_account_manager, get_account_names
+from core_account_manager import get_account_manager, get_account_names, get_account_session
 from aws_cloudformation import CloudFormationManager
+from utils_helpers import Helpers
+
+_STACK_STATUSES = (
+    "CREATE_IN_PROGRESS", "CREATE_FAILED", "CREATE_COMPLETE",
+    "ROLLBACK_IN_PROGRESS", "ROLLBACK_FAILED", "ROLLBACK_COMPLETE",
+    "DELETE_IN_PROGRESS", "DELETE_FAILED", "DELETE_COMPLETE",
+    "UPDATE_IN_PROGRESS", "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS", "UPDATE_COMPLETE", "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_IN_PROGRESS", "UPDATE_ROLLBACK_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS", "UPDATE_ROLLBACK_COMPLETE",
+    "REVIEW_IN_PROGRESS", "IMPORT_IN_PROGRESS", "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_IN_PROGRESS", "IMPORT_ROLLBACK_FAILED", "IMPORT_ROLLBACK_COMPLETE"
+)
+
+# Stack status -> icon, computed once; unknown statuses fall back to ❌
+_STATUS_ICONS = {
+    status: "✅" if "COMPLETE" in status else "🔄" if "IN_PROGRESS" in status else "❌"
+    for status in _STACK_STATUSES
+}
+
+_VPC_TEMPLATE = """{
+  "AWSTemplateFormatVersion": "2010-09-09",
+  "Description": "VPC with public and private subnets",
+  "Resources": {
+    "VPC": {
+      "Type": "AWS::EC2::VPC",
+      "Properties": {
+        "CidrBlock": "10.0.0.0/16",
+        "EnableDnsHostnames": true,
+        "Tags": [{"Key": "Name", "Value": "CloudIDP-VPC"}]
+      }
+    }
+  }
+}"""
+
+_QUICK_START_OPTIONS = (
+    "VPC with Public/Private Subnets",
+    "EC2 Instance with Security Group",
+    "RDS Database",
+    "S3 Bucket with Encryption",
+    "Lambda Function with API Gateway"
+)
+
+# Quick start name -> template body; options without an entry use the placeholder
+_QUICK_TEMPLATES: Dict[str, str] = {
+    "VPC with Public/Private Subnets": _VPC_TEMPLATE
+}
+_QUICK_TEMPLATE_PLACEHOLDER = "# Quick start template placeholder"
+
+# Status groups each tab shows, filtered from one shared stack listing
+_ACTIVE_STATUSES = frozenset(("CREATE_IN_PROGRESS", "UPDATE_IN_PROGRESS",
+                              "DELETE_IN_PROGRESS", "ROLLBACK_IN_PROGRESS"))
+_STABLE_STATUSES = frozenset(("CREATE_COMPLETE", "UPDATE_COMPLETE"))
+_FAILED_STATUSES = frozenset(("CREATE_FAILED", "UPDATE_FAILED", "ROLLBACK_COMPLETE"))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_stacks(_cfn_mgr: CloudFormationManager, account: str) -> List[Dict]:
+    """List all (non-deleted) stacks for an account; tabs filter this one listing"""
+    return _cfn_mgr.list_stacks()
+
+def _deploy_one(session, region: str, stack_name: str, template_body: str,
+                capabilities: List[str]) -> Dict:
+    """Create a stack in one region using the account's shared session"""
+    return CloudFormationManager(session, region).create_stack(
+        stack_name=stack_name,
+        template_body=template_body,
+        capabilities=capabilities
+    )
 
 class ProvisioningModule:
     """Provisioning & Deployment functionality"""
@@ -40,48 +109,52 @@ class ProvisioningModule:
         if not selected_account:
             return
         
-        session = account_mgr.get_session(selected_account)
+        session = get_account_session(selected_account)
         if not session:
             st.error("Failed to get session")
             return
         
         cfn_mgr = CloudFormationManager(session)
         
-        # Create tabs
-        tabs = st.tabs([
-            "📚 Stack Library",
-            "🚀 Deploy Stack",
-            "🔄 Active Deployments",
-            "📝 Change Sets",
-            "🌍 Multi-Region",
-            "⏮️ Rollback"
-        ])
+        if st.button("🔄 Refresh", key="provisioning_refresh"):
+            _list_stacks.clear()
         
-        with tabs[0]:
-            ProvisioningModule._render_stack_library(cfn_mgr)
+        # Only the selected view renders, so only its AWS calls run on a rerun
+        view = st.radio(
+            "View",
+            [
+                "📚 Stack Library",
+                "🚀 Deploy Stack",
+                "🔄 Active Deployments",
+                "📝 Change Sets",
+                "🌍 Multi-Region",
+                "⏮️ Rollback"
+            ],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="provisioning_view"
+        )
         
-        with tabs[1]:
+        if view == "📚 Stack Library":
+            ProvisioningModule._render_stack_library(cfn_mgr, _list_stacks(cfn_mgr, selected_account))
+        elif view == "🚀 Deploy Stack":
             ProvisioningModule._render_deploy_stack(cfn_mgr)
-        
-        with tabs[2]:
-            ProvisioningModule._render_active_deployments(cfn_mgr)
-        
-        with tabs[3]:
-            ProvisioningModule._render_change_sets(cfn_mgr)
-        
-        with tabs[4]:
-            ProvisioningModule._render_multi_region()
-        
-        with tabs[5]:
-            ProvisioningModule._render_rollback(cfn_mgr)
+        elif view == "🔄 Active Deployments":
+            ProvisioningModule._render_active_deployments(cfn_mgr, _list_stacks(cfn_mgr, selected_account))
+        elif view == "📝 Change Sets":
+            ProvisioningModule._render_change_sets(cfn_mgr, _list_stacks(cfn_mgr, selected_account))
+        elif view == "🌍 Multi-Region":
+            ProvisioningModule._render_multi_region(session)
+        elif view == "⏮️ Rollback":
+            ProvisioningModule._render_rollback(cfn_mgr, _list_stacks(cfn_mgr, selected_account))
     
     @staticmethod
-    def _render_stack_library(cfn_mgr: CloudFormationManager):
+    def _render_stack_library(cfn_mgr: CloudFormationManager, all_stacks: List[Dict]):
         """Stack library and templates"""
         st.subheader("📚 CloudFormation Stack Library")
         
         # List existing stacks
-        stacks = cfn_mgr.list_stacks()
+        stacks = all_stacks
         
         if stacks:
             st.metric("Total Stacks", len(stacks))
@@ -99,7 +172,7 @@ class ProvisioningModule:
             
             # Display stacks
             for stack in filtered_stacks:
-                status_icon = "✅" if "COMPLETE" in stack['status'] else "🔄" if "IN_PROGRESS" in stack['status'] else "❌"
+                status_icon = _STATUS_ICONS.get(stack['status'], "❌")
                 
                 with st.expander(f"{status_icon} {stack['stack_name']} - {stack['status']}"):
                     col1, col2 = st.columns(2)
@@ -125,7 +198,7 @@ class ProvisioningModule:
                         if st.button("📋 Resources", key=f"resources_{stack['stack_name']}"):
                             resources = cfn_mgr.list_stack_resources(stack['stack_name'])
                             if resources:
-                                res_df = pd.DataFrame(resources)
+                                res_df = pd.DataFrame.from_records(resources)
                                 st.dataframe(res_df, use_container_width=True)
                     
                     with col3:
@@ -139,6 +212,7 @@ class ProvisioningModule:
                             result = cfn_mgr.delete_stack(stack['stack_name'])
                             if result.get('success'):
                                 st.success(f"Stack deletion initiated")
+                                _list_stacks.clear()
                                 st.rerun()
         else:
             st.info("No stacks found in this account")
@@ -171,32 +245,10 @@ class ProvisioningModule:
             
             else:
                 # Quick start templates
-                quick_template = st.selectbox("Select Quick Start", [
-                    "VPC with Public/Private Subnets",
-                    "EC2 Instance with Security Group",
-                    "RDS Database",
-                    "S3 Bucket with Encryption",
-                    "Lambda Function with API Gateway"
-                ])
+                quick_template = st.selectbox("Select Quick Start", _QUICK_START_OPTIONS)
                 
                 # Load template based on selection
-                if quick_template == "VPC with Public/Private Subnets":
-                    template_body = """{
-  "AWSTemplateFormatVersion": "2010-09-09",
-  "Description": "VPC with public and private subnets",
-  "Resources": {
-    "VPC": {
-      "Type": "AWS::EC2::VPC",
-      "Properties": {
-        "CidrBlock": "10.0.0.0/16",
-        "EnableDnsHostnames": true,
-        "Tags": [{"Key": "Name", "Value": "CloudIDP-VPC"}]
-      }
-    }
-  }
-}"""
-                else:
-                    template_body = "# Quick start template placeholder"
+                template_body = _QUICK_TEMPLATES.get(quick_template, _QUICK_TEMPLATE_PLACEHOLDER)
                 
                 template_url = None
                 st.code(template_body, language='json')
@@ -230,7 +282,6 @@ class ProvisioningModule:
                     st.error("Template source is required")
                 else:
                     # Parse parameters and tags
-                    import json
                     parameters = None
                     tags = None
                     
@@ -239,7 +290,7 @@ class ProvisioningModule:
                             parameters = json.loads(params_input)
                         if tags_input:
                             tags = json.loads(tags_input)
-                    except:
+                    except json.JSONDecodeError:
                         st.error("Invalid JSON format for parameters or tags")
                         return
                     
@@ -255,21 +306,19 @@ class ProvisioningModule:
                         
                         if result.get('success'):
                             st.success(f"✅ Stack deployment initiated!")
+                            _list_stacks.clear()
                             st.info(f"Stack ID: {result.get('stack_id')}")
                             st.balloons()
                         else:
                             st.error(f"❌ {result.get('error')}")
     
     @staticmethod
-    def _render_active_deployments(cfn_mgr: CloudFormationManager):
+    def _render_active_deployments(cfn_mgr: CloudFormationManager, all_stacks: List[Dict]):
         """Active deployments"""
         st.subheader("🔄 Active Deployments")
         
         # Get stacks in progress
-        stacks = cfn_mgr.list_stacks(
-            status_filter=["CREATE_IN_PROGRESS", "UPDATE_IN_PROGRESS", 
-                          "DELETE_IN_PROGRESS", "ROLLBACK_IN_PROGRESS"]
-        )
+        stacks = [s for s in all_stacks if s['status'] in _ACTIVE_STATUSES]
         
         if stacks:
             st.write(f"**Active Deployments:** {len(stacks)}")
@@ -295,7 +344,7 @@ class ProvisioningModule:
             st.success("✅ No active deployments")
     
     @staticmethod
-    def _render_change_sets(cfn_mgr: CloudFormationManager):
+    def _render_change_sets(cfn_mgr: CloudFormationManager, all_stacks: List[Dict]):
         """Change sets"""
         st.subheader("📝 Change Sets")
         
@@ -306,9 +355,7 @@ class ProvisioningModule:
         """)
         
         # Get existing stacks for change sets
-        stacks = cfn_mgr.list_stacks(
-            status_filter=["CREATE_COMPLETE", "UPDATE_COMPLETE"]
-        )
+        stacks = [s for s in all_stacks if s['status'] in _STABLE_STATUSES]
         
         if stacks:
             selected_stack = st.selectbox(
@@ -343,7 +390,7 @@ class ProvisioningModule:
             st.info("No stacks available for change sets")
     
     @staticmethod
-    def _render_multi_region():
+    def _render_multi_region(session):
         """Multi-region deployment"""
         st.subheader("🌍 Multi-Region Deployment")
         
@@ -364,16 +411,48 @@ class ProvisioningModule:
             stack_name_prefix = st.text_input("Stack Name Prefix",
                 placeholder="my-multi-region-stack")
             
+            template_body = st.text_area("CloudFormation Template (JSON/YAML)",
+                placeholder='{\n  "AWSTemplateFormatVersion": "2010-09-09",\n  ...\n}',
+                height=200,
+                key="multi_region_template")
+            
+            capabilities = st.multiselect("Required Capabilities", [
+                "CAPABILITY_IAM",
+                "CAPABILITY_NAMED_IAM",
+                "CAPABILITY_AUTO_EXPAND"
+            ], key="multi_region_capabilities")
+            
             if st.button("Deploy to All Regions"):
-                if stack_name_prefix:
-                    for region in regions:
-                        st.info(f"Deploying to {region}...")
-                    st.success(f"✅ Deployment initiated in {len(regions)} regions")
-                else:
+                if not stack_name_prefix:
                     st.error("Stack name prefix required")
+                elif not template_body:
+                    st.error("Template is required")
+                else:
+                    # CreateStack is independent per region; fire all regions at once
+                    with st.spinner(f"Deploying to {len(regions)} regions..."):
+                        with Helpers.thread_pool(max_workers=len(regions)) as executor:
+                            futures = {
+                                executor.submit(_deploy_one, session, region, f"{stack_name_prefix}-{region}",
+                                                template_body, capabilities): region
+                                for region in regions
+                            }
+                            
+                            succeeded = 0
+                            for future in as_completed(futures):
+                                region = futures[future]
+                                result = future.result()
+                                if result.get('success'):
+                                    succeeded += 1
+                                    st.success(f"✅ {region}: {result.get('stack_id')}")
+                                else:
+                                    st.error(f"❌ {region}: {result.get('error')}")
+                    
+                    if succeeded:
+                        _list_stacks.clear()
+                    st.info(f"Deployment initiated in {succeeded} of {len(regions)} regions")
     
     @staticmethod
-    def _render_rollback(cfn_mgr: CloudFormationManager):
+    def _render_rollback(cfn_mgr: CloudFormationManager, all_stacks: List[Dict]):
         """Rollback operations"""
         st.subheader("⏮️ Rollback & Recovery")
         
@@ -384,9 +463,7 @@ class ProvisioningModule:
         """)
         
         # Get failed stacks
-        failed_stacks = cfn_mgr.list_stacks(
-            status_filter=["CREATE_FAILED", "UPDATE_FAILED", "ROLLBACK_COMPLETE"]
-        )
+        failed_stacks = [s for s in all_stacks if s['status'] in _FAILED_STATUSES]
         
         if failed_stacks:
             st.warning(f"⚠️ Found {len(failed_stacks)} stack(s) requiring attention")
@@ -399,15 +476,18 @@ class ProvisioningModule:
                     # Show events to understand failure
                     events = cfn_mgr.get_stack_events(stack['stack_name'], limit=5)
                     if events:
-                        st.markdown("**Failure Events:**")
-                        for event in events:
-                            if "FAILED" in event['status']:
-                                st.error(f"{event['logical_id']}: {event['reason']}")
+                        events_df = pd.DataFrame.from_records(events)
+                        failed = events_df[events_df['status'].str.contains('FAILED', na=False)]
+                        if not failed.empty:
+                            st.markdown("**Failure Events:**")
+                            st.dataframe(failed[['logical_id', 'reason', 'status']],
+                                         use_container_width=True, hide_index=True)
                     
                     if st.button(f"Delete Failed Stack", key=f"rollback_{stack['stack_name']}"):
                         result = cfn_mgr.delete_stack(stack['stack_name'])
                         if result.get('success'):
                             st.success("Stack deletion initiated")
+                            _list_stacks.clear()
                             st.rerun()
         else:
             st.success("✅ No failed stacks found")
@@ -5,12 +5,190 @@ Cross-account resource discovery and management
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, List
+import logging
+from concurrent.futures import as_completed
+from typing import Dict, List, Tuple
+from botocore.exceptions import BotoCoreError, ClientError
 from config_settings import AppConfig
-from core_account_manager import get_account_manager
+from core_account_manager import get_account_manager, get_assumed_session, clear_session_cache
 from core_session_manager import SessionManager
+from aws_ec2 import EC2Service
+from aws_rds import RDSService
+from aws_additional_services import S3Service
 from utils_helpers import Helpers
 
+logger = logging.getLogger(__name__)
+
+# Inventory fan-out is I/O bound; cap workers to stay under API rate limits and the client pool size
+_MAX_WORKERS = 20
+
+# Inventory is accumulated column-wise (one list per column) in this order
+EC2_COLUMNS = ('Instance ID', 'Account', 'Region', 'Type', 'State', 'AZ',
+               'Private IP', 'Public IP', 'Launch Time', 'Name')
+RDS_COLUMNS = ('DB Instance ID', 'Account', 'Region', 'Engine', 'Class', 'Status',
+               'Endpoint', 'Multi-AZ', 'Storage')
+S3_COLUMNS = ('Bucket Name', 'Account', 'Region', 'Created')
+SEARCH_COLUMNS = ('Resource Type', 'Resource ID', 'Account', 'Region', 'Status', 'Tags')
+
+# Rows sent to the browser per table; larger inventories are truncated (CSV export stays complete)
+MAX_ROWS = 1000
+
+class InventoryFetchError(Exception):
+    """A service wrapper reported a failed listing (throttling, AccessDenied, ...)"""
+
+def _empty_columns(columns) -> Dict[str, List]:
+    """Column dict with no rows"""
+    return {column: [] for column in columns}
+
+def _show_dataframe(df: pd.DataFrame):
+    """Render a DataFrame, capped at MAX_ROWS so Arrow serialization stays bounded"""
+    if len(df) > MAX_ROWS:
+        st.info(f"Showing first {MAX_ROWS} of {len(df)} rows — use filters to narrow.")
+        df = df.head(MAX_ROWS)
+    st.dataframe(df, use_container_width=True, hide_index=True)
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _df_to_csv(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV once per distinct content (bounded: contents change on each refetch)"""
+    return df.to_csv(index=False).encode('utf-8')
+
+def _resolve_sessions(accounts) -> List[Tuple]:
+    """Assume each account's role once (concurrently) and pair it with its session"""
+    with Helpers.thread_pool(max_workers=_MAX_WORKERS) as executor:
+        sessions = list(executor.map(
+            lambda acc: get_assumed_session(acc.account_id, acc.account_name, acc.role_arn),
+            accounts
+        ))
+    return [(acc, session) for acc, session in zip(accounts, sessions) if session]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_ec2(_session, acc, region) -> Dict[str, List]:
+    """Fetch EC2 inventory columns for one account/region"""
+    ec2 = EC2Service(_session.session, region)
+    result = ec2.list_instances()
+    
+    if result['success']:
+        instances = result['instances']
+        return {
+            'Instance ID': [i['instance_id'] for i in instances],
+            'Account': [acc.account_name] * len(instances),
+            'Region': [region] * len(instances),
+            'Type': [i['instance_type'] for i in instances],
+            'State': [i['state'] for i in instances],
+            'AZ': [i['availability_zone'] for i in instances],
+            'Private IP': [i['private_ip'] for i in instances],
+            'Public IP': [i['public_ip'] for i in instances],
+            'Launch Time': [Helpers.time_ago(i['launch_time']) for i in instances],
+            'Name': [i['name'] for i in instances]
+        }
+    
+    raise InventoryFetchError(result['error'])
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_rds(_session, acc, region) -> Dict[str, List]:
+    """Fetch RDS inventory columns for one account/region"""
+    rds = RDSService(_session.session, region)
+    result = rds.list_db_instances()
+    
+    if result['success']:
+        databases = result['instances']
+        return {
+            'DB Instance ID': [db['db_instance_id'] for db in databases],
+            'Account': [acc.account_name] * len(databases),
+            'Region': [region] * len(databases),
+            'Engine': [f"{db['engine']} {db['engine_version']}" for db in databases],
+            'Class': [db['db_instance_class'] for db in databases],
+            'Status': [db['status'] for db in databases],
+            'Endpoint': [db['endpoint'] for db in databases],
+            'Multi-AZ': ['✅' if db['multi_az'] else '❌' for db in databases],
+            'Storage': [f"{db['allocated_storage']} GB" for db in databases]
+        }
+    
+    raise InventoryFetchError(result['error'])
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_s3(_session, acc) -> Dict[str, List]:
+    """Fetch S3 inventory columns for one account (bucket listing is global and changes rarely)"""
+    s3 = S3Service(_session.session)
+    result = s3.list_buckets()
+    
+    if result['success']:
+        buckets = result['buckets']
+        return {
+            'Bucket Name': [b['bucket_name'] for b in buckets],
+            'Account': [acc.account_name] * len(buckets),
+            'Region': [b['region'] for b in buckets],
+            'Created': [Helpers.time_ago(b['creation_date']) for b in buckets]
+        }
+    
+    raise InventoryFetchError(result['error'])
+
+def _search_region(session, acc, region, resource_type) -> Dict[str, List]:
+    """Collect one account/region's searchable resources (text matching happens on the merged frame)"""
+    if resource_type == 'All Types' or resource_type == 'EC2':
+        ec2 = EC2Service(session.session, region)
+        ec2_result = ec2.list_instances()
+        
+        if not ec2_result['success']:
+            raise InventoryFetchError(ec2_result['error'])
+        
+        instances = ec2_result['instances']
+        return {
+            'Resource Type': ['EC2'] * len(instances),
+            'Resource ID': [i['instance_id'] for i in instances],
+            'Account': [acc.account_name] * len(instances),
+            'Region': [region] * len(instances),
+            'Status': [i['state'] for i in instances],
+            'Tags': [str(i.get('tags', {})) for i in instances]
+        }
+    
+    return _empty_columns(SEARCH_COLUMNS)
+
+def _search_buckets(session, acc) -> Dict[str, List]:
+    """Collect one account's buckets for search (S3 is account-global, so once per account)"""
+    buckets = _fetch_s3(session, acc)
+    count = len(buckets['Bucket Name'])
+    return {
+        'Resource Type': ['S3'] * count,
+        'Resource ID': buckets['Bucket Name'],
+        'Account': buckets['Account'],
+        'Region': buckets['Region'],
+        'Status': ['available'] * count,
+        'Tags': [''] * count
+    }
+
+def _fan_out(fetch, tasks, columns) -> pd.DataFrame:
+    """
+    Run fetch(*task) for every task concurrently and merge the returned columns
+    
+    Tasks are (session, account, [region, ...]) tuples; AWS errors from one task are
+    logged and reported and do not abort the others. Fetchers raise on failure
+    (including failures the service wrappers report as success=False), so failed
+    fetches are never cached.
+    """
+    merged = _empty_columns(columns)
+    failures = []
+    
+    with Helpers.thread_pool(max_workers=_MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch, *task): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                part = future.result()
+            except (ClientError, BotoCoreError, InventoryFetchError) as e:
+                task = futures[future]
+                target = f"{task[1].account_name} / {task[2]}" if len(task) > 2 else task[1].account_name
+                logger.warning("Inventory fetch failed for %s: %s", target, e)
+                failures.append(f"{target}: {e}")
+                continue
+            
+            for column in columns:
+                merged[column].extend(part[column])
+    
+    for failure in failures:
+        st.warning(f"⚠️ {failure}")
+    
+    return pd.DataFrame(merged, columns=list(columns))
+
 class ResourceInventoryModule:
     """Global resource inventory across all accounts"""
     
@@ -27,32 +205,43 @@ class ResourceInventoryModule:
             st.error("❌ AWS account manager not configured")
             return
         
-        # Sub-tabs
-        tabs = st.tabs([
-            "🔍 Resource Search",
-            "💻 EC2 Instances",
-            "🗄️ RDS Databases",
-            "📦 S3 Buckets",
-            "⚡ Lambda Functions",
-            "🔢 DynamoDB Tables"
-        ])
-        
-        with tabs[0]:
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔄 Refresh inventory", key="inventory_refresh"):
+                _fetch_ec2.clear()
+                _fetch_rds.clear()
+                _fetch_s3.clear()
+        with col2:
+            if st.button("🔄 Refresh credentials", key="inventory_refresh_credentials"):
+                clear_session_cache()
+        
+        # Sub-views: only the selected one renders, so only its accounts x regions fetch runs
+        view = st.radio(
+            "View",
+            [
+                "🔍 Resource Search",
+                "💻 EC2 Instances",
+                "🗄️ RDS Databases",
+                "📦 S3 Buckets",
+                "⚡ Lambda Functions",
+                "🔢 DynamoDB Tables"
+            ],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="inventory_view"
+        )
+        
+        if view == "🔍 Resource Search":
             ResourceInventoryModule._render_resource_search(account_mgr)
-        
-        with tabs[1]:
+        elif view == "💻 EC2 Instances":
             ResourceInventoryModule._render_ec2_instances(account_mgr)
-        
-        with tabs[2]:
+        elif view == "🗄️ RDS Databases":
             ResourceInventoryModule._render_rds_databases(account_mgr)
-        
-        with tabs[3]:
+        elif view == "📦 S3 Buckets":
             ResourceInventoryModule._render_s3_buckets(account_mgr)
-        
-        with tabs[4]:
+        elif view == "⚡ Lambda Functions":
             ResourceInventoryModule._render_lambda_functions(account_mgr)
-        
-        with tabs[5]:
+        elif view == "🔢 DynamoDB Tables":
             ResourceInventoryModule._render_dynamodb_tables(account_mgr)
     
     @staticmethod
@@ -91,50 +280,38 @@ class ResourceInventoryModule:
                     search_scope
                 )
                 
-                if results:
+                if not results.empty:
                     st.success(f"✅ Found {len(results)} resources")
-                    df = pd.DataFrame(results)
-                    st.dataframe(df, use_container_width=True, hide_index=True)
+                    _show_dataframe(results)
                 else:
                     st.info("No resources found matching your search criteria")
     
     @staticmethod
     def _perform_global_search(account_mgr, search_text, resource_type, scope):
         """Perform global resource search"""
-        results = []
-        
         accounts = AppConfig.load_aws_accounts()
         selected_accounts = SessionManager.get_selected_accounts()
         
         if scope == 'Selected Account Only' and selected_accounts != 'all':
             accounts = [a for a in accounts if a.account_id in selected_accounts]
         
-        for acc in accounts[:3]:  # Limit to first 3 for performance
-            try:
-                session = account_mgr.assume_role(
-                    acc.account_id,
-                    acc.account_name,
-                    acc.role_arn
-                )
-                
-                if session and (resource_type == 'All Types' or resource_type == 'EC2'):
-                    from aws_ec2 import EC2Service
-                    ec2 = EC2Service(session.session, acc.regions[0])
-                    ec2_result = ec2.list_instances()
-                    
-                    if ec2_result['success']:
-                        for inst in ec2_result['instances']:
-                            if not search_text or search_text.lower() in inst['instance_id'].lower():
-                                results.append({
-                                    'Resource Type': 'EC2',
-                                    'Resource ID': inst['instance_id'],
-                                    'Account': acc.account_name,
-                                    'Region': acc.regions[0],
-                                    'Status': inst['state'],
-                                    'Tags': str(inst.get('tags', {}))
-                                })
-            except:
-                pass
+        sessions = _resolve_sessions(accounts)
+        results = _fan_out(
+            _search_region,
+            [(session, acc, region, resource_type) for acc, session in sessions for region in acc.regions],
+            SEARCH_COLUMNS
+        )
+        
+        if resource_type in ('All Types', 'S3'):
+            buckets = _fan_out(_search_buckets, [(session, acc) for acc, session in sessions], SEARCH_COLUMNS)
+            results = pd.concat([results, buckets], ignore_index=True)
+        
+        if search_text and not results.empty:
+            # Case-insensitive substring match on IDs and tags (tags include Name)
+            mask = results[['Resource ID', 'Tags']].apply(
+                lambda column: column.str.contains(search_text, case=False, regex=False, na=False)
+            ).any(axis=1)
+            results = results[mask]
         
         return results
     
@@ -150,42 +327,15 @@ class ResourceInventoryModule:
         if selected_account_ids != 'all':
             accounts = [a for a in accounts if a.account_id in selected_account_ids]
         
-        all_instances = []
-        
         with st.spinner("Loading EC2 instances..."):
-            for acc in accounts:
-                for region in acc.regions:
-                    try:
-                        session = account_mgr.assume_role(
-                            acc.account_id,
-                            acc.account_name,
-                            acc.role_arn
-                        )
-                        
-                        if session:
-                            from aws_ec2 import EC2Service
-                            ec2 = EC2Service(session.session, region)
-                            result = ec2.list_instances()
-                            
-                            if result['success']:
-                                for inst in result['instances']:
-                                    all_instances.append({
-                                        'Instance ID': inst['instance_id'],
-                                        'Account': acc.account_name,
-                                        'Region': region,
-                                        'Type': inst['instance_type'],
-                                        'State': inst['state'],
-                                        'AZ': inst['availability_zone'],
-                                        'Private IP': inst['private_ip'],
-                                        'Public IP': inst['public_ip'],
-                                        'Launch Time': Helpers.time_ago(inst['launch_time']),
-                                        'Name': inst['tags'].get('Name', 'N/A')
-                                    })
-                    except:
-                        pass
+            all_df = _fan_out(
+                _fetch_ec2,
+                [(session, acc, region) for acc, session in _resolve_sessions(accounts) for region in acc.regions],
+                EC2_COLUMNS
+            )
         
-        if all_instances:
-            st.success(f"✅ Found {len(all_instances)} EC2 instances")
+        if not all_df.empty:
+            st.success(f"✅ Found {len(all_df)} EC2 instances")
             
             # Filter controls
             col1, col2 = st.columns(2)
@@ -197,20 +347,16 @@ class ResourceInventoryModule:
                 )
             
             # Apply filters
-            filtered = [i for i in all_instances if i['State'] in state_filter]
-            
-            df = pd.DataFrame(filtered)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            df = all_df[all_df['State'].isin(state_filter)]
+            _show_dataframe(df)
             
             # Export option
-            if st.button("📥 Export to CSV"):
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    "Download CSV",
-                    csv,
-                    "ec2_inventory.csv",
-                    "text/csv"
-                )
+            st.download_button(
+                "📥 Download CSV",
+                _df_to_csv(df),
+                "ec2_inventory.csv",
+                "text/csv"
+            )
         else:
             st.info("No EC2 instances found")
     
@@ -221,43 +367,16 @@ class ResourceInventoryModule:
         st.markdown("### 🗄️ RDS Databases")
         
         accounts = AppConfig.load_aws_accounts()
-        all_databases = []
-        
         with st.spinner("Loading RDS databases..."):
-            for acc in accounts:
-                for region in acc.regions:
-                    try:
-                        session = account_mgr.assume_role(
-                            acc.account_id,
-                            acc.account_name,
-                            acc.role_arn
-                        )
-                        
-                        if session:
-                            from aws_rds import RDSService
-                            rds = RDSService(session.session, region)
-                            result = rds.list_db_instances()
-                            
-                            if result['success']:
-                                for db in result['instances']:
-                                    all_databases.append({
-                                        'DB Instance ID': db['db_instance_id'],
-                                        'Account': acc.account_name,
-                                        'Region': region,
-                                        'Engine': f"{db['engine']} {db['engine_version']}",
-                                        'Class': db['db_instance_class'],
-                                        'Status': db['status'],
-                                        'Endpoint': db['endpoint'],
-                                        'Multi-AZ': '✅' if db['multi_az'] else '❌',
-                                        'Storage': f"{db['allocated_storage']} GB"
-                                    })
-                    except:
-                        pass
+            df = _fan_out(
+                _fetch_rds,
+                [(session, acc, region) for acc, session in _resolve_sessions(accounts) for region in acc.regions],
+                RDS_COLUMNS
+            )
         
-        if all_databases:
-            st.success(f"✅ Found {len(all_databases)} RDS databases")
-            df = pd.DataFrame(all_databases)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if not df.empty:
+            st.success(f"✅ Found {len(df)} RDS databases")
+            _show_dataframe(df)
         else:
             st.info("No RDS databases found")
     
@@ -268,37 +387,12 @@ class ResourceInventoryModule:
         st.markdown("### 📦 S3 Buckets")
         
         accounts = AppConfig.load_aws_accounts()
-        all_buckets = []
-        
         with st.spinner("Loading S3 buckets..."):
-            for acc in accounts:
-                try:
-                    session = account_mgr.assume_role(
-                        acc.account_id,
-                        acc.account_name,
-                        acc.role_arn
-                    )
-                    
-                    if session:
-                        from aws_additional_services import S3Service
-                        s3 = S3Service(session.session)
-                        result = s3.list_buckets()
-                        
-                        if result['success']:
-                            for bucket in result['buckets']:
-                                all_buckets.append({
-                                    'Bucket Name': bucket['bucket_name'],
-                                    'Account': acc.account_name,
-                                    'Region': bucket['region'],
-                                    'Created': Helpers.time_ago(bucket['creation_date'])
-                                })
-                except:
-                    pass
+            df = _fan_out(_fetch_s3, [(session, acc) for acc, session in _resolve_sessions(accounts)], S3_COLUMNS)
         
-        if all_buckets:
-            st.success(f"✅ Found {len(all_buckets)} S3 buckets")
-            df = pd.DataFrame(all_buckets)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        if not df.empty:
+            st.success(f"✅ Found {len(df)} S3 buckets")
+            _show_dataframe(df)
         else:
             st.info("No S3 buckets found")
     
@@ -5,9 +5,113 @@ UI for security monitoring and compliance tracking
 
 import streamlit as st
 import pandas as pd
-from core_account_manager import get_account_manager, get_account_names
-from aws_security import SecurityManager
+from collections import Counter
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Dict, List, Optional
+from core_account_manager import get_account_manager, get_account_names, get_service_manager
+from aws_security import ComplianceSummary, SecurityManager
 from aws_cloudwatch import CloudWatchManager
+from utils_helpers import Helpers
+
+# Upper bound on alarms / log groups pulled into the tables and selectboxes
+_MAX_ITEMS = 1000
+
+# Config rule fields shown in the rules table
+_CONFIG_RULE_COLUMNS = ('name', 'source', 'state')
+
+# How far back a filtered log search looks
+_LOG_SEARCH_WINDOW = timedelta(hours=1)
+
+# Security Hub findings are loaded a page at a time so the table fills in as they arrive
+_FINDINGS_LIMIT = 100
+_FINDINGS_PAGE_SIZE = 50
+
+# Security Hub severity label -> icon
+_SEVERITY_ICON = {
+    'CRITICAL': '🔴',
+    'HIGH': '🟠',
+    'MEDIUM': '🟡',
+    'LOW': '🟢',
+    'INFORMATIONAL': '⚪'
+}
+
+# GuardDuty severity bands: [0, 4) low, [4, 7) medium, 7+ high
+_GUARDDUTY_SEVERITY_BINS = (0, 4, 7, float('inf'))
+_GUARDDUTY_SEVERITY_ICONS = ('🟢', '🟡', '🔴')
+
+# Alarm state -> icon (INSUFFICIENT_DATA and anything else is shown as pending)
+_ALARM_STATE_ICON = {'ALARM': '🔴', 'OK': '🟢'}
+
+# AWS lookups are cached per account (and filter) for a minute so reruns from
+# tab switches and filter changes don't go back to AWS. The manager argument is
+# underscore-prefixed so Streamlit keys the cache on the account name instead.
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _security_score(_security_mgr: SecurityManager, account: str) -> Dict:
+    """Security score for an account"""
+    return _security_mgr.get_security_score()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _hub_summary(_security_mgr: SecurityManager, account: str) -> Dict:
+    """Security Hub summary for an account"""
+    return _security_mgr.get_security_hub_summary()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _security_findings_page(_security_mgr: SecurityManager, account: str,
+                            severity: Optional[str], next_token: Optional[str]) -> Dict:
+    """One page of Security Hub findings, cached per severity filter and page token"""
+    return _security_mgr.get_security_findings_page(
+        severity=severity, page_size=_FINDINGS_PAGE_SIZE, next_token=next_token
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _guardduty_detector(_security_mgr: SecurityManager, account: str) -> Optional[str]:
+    """GuardDuty detector ID for an account"""
+    return _security_mgr.get_guardduty_detector()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _guardduty_findings(_security_mgr: SecurityManager, account: str, detector_id: str) -> List[Dict]:
+    """GuardDuty findings for a detector"""
+    return _security_mgr.list_guardduty_findings(detector_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _compliance_summary(_security_mgr: SecurityManager, account: str) -> ComplianceSummary:
+    """AWS Config compliance summary for an account"""
+    return _security_mgr.get_compliance_summary()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _config_rules(_security_mgr: SecurityManager, account: str) -> List[tuple]:
+    """AWS Config rules for an account, reduced to the columns the rules table shows"""
+    return list(map(itemgetter(*_CONFIG_RULE_COLUMNS), _security_mgr.list_config_rules()))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _non_compliant_resources(_security_mgr: SecurityManager, account: str) -> List[Dict]:
+    """Non-compliant AWS Config resources for an account"""
+    return _security_mgr.get_non_compliant_resources()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _alarms(_cw_mgr: CloudWatchManager, account: str, state: Optional[str]) -> List[Dict]:
+    """CloudWatch alarms for an account, cached per state filter"""
+    return _cw_mgr.list_alarms(state_value=state, limit=_MAX_ITEMS)
+
+# The logs view only needs names, so only the names are cached
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _log_group_names(_cw_mgr: CloudWatchManager, account: str) -> List[str]:
+    """CloudWatch log group names for an account"""
+    return list(map(itemgetter('log_group_name'), _cw_mgr.list_log_groups(limit=_MAX_ITEMS)))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _log_stream_names(_cw_mgr: CloudWatchManager, account: str, log_group: str) -> List[str]:
+    """Log stream names in a log group, most recently written first"""
+    return list(map(itemgetter('log_stream_name'), _cw_mgr.list_log_streams(log_group)))
+
+_CACHED_LOOKUPS = (
+    _security_score, _hub_summary, _security_findings_page, _guardduty_detector,
+    _guardduty_findings, _compliance_summary, _config_rules, _non_compliant_resources,
+    _alarms, _log_group_names, _log_stream_names
+)
 
 class SecurityComplianceUI:
     """UI for Security & Compliance Management"""
@@ -40,81 +144,87 @@ class SecurityComplianceUI:
         if not selected_account:
             return
         
-        session = account_mgr.get_session(selected_account)
-        if not session:
+        if st.button("🔄 Refresh", key="security_refresh"):
+            for lookup in _CACHED_LOOKUPS:
+                lookup.clear()
+        
+        security_mgr = get_service_manager(SecurityManager, selected_account)
+        cw_mgr = get_service_manager(CloudWatchManager, selected_account)
+        if not security_mgr or not cw_mgr:
             st.error(f"Failed to get session")
             return
         
-        # Initialize managers
-        security_mgr = SecurityManager(session)
-        cw_mgr = CloudWatchManager(session)
-        
-        # Tabs
-        tabs = st.tabs([
-            "🛡️ Security Dashboard",
-            "🔍 Security Findings",
-            "⚠️ GuardDuty Threats",
-            "✅ Config Compliance",
-            "📊 CloudWatch Alarms",
-            "📝 CloudWatch Logs"
-        ])
-        
-        with tabs[0]:
-            SecurityComplianceUI._render_security_dashboard(security_mgr)
-        
-        with tabs[1]:
-            SecurityComplianceUI._render_security_findings(security_mgr)
-        
-        with tabs[2]:
-            SecurityComplianceUI._render_guardduty(security_mgr)
-        
-        with tabs[3]:
-            SecurityComplianceUI._render_config_compliance(security_mgr)
-        
-        with tabs[4]:
-            SecurityComplianceUI._render_cloudwatch_alarms(cw_mgr)
+        # Only the selected view runs, so the other views make no AWS calls
+        view = st.radio(
+            "View",
+            [
+                "🛡️ Security Dashboard",
+                "🔍 Security Findings",
+                "⚠️ GuardDuty Threats",
+                "✅ Config Compliance",
+                "📊 CloudWatch Alarms",
+                "📝 CloudWatch Logs"
+            ],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="security_view"
+        )
         
-        with tabs[5]:
-            SecurityComplianceUI._render_cloudwatch_logs(cw_mgr)
+        if view == "🛡️ Security Dashboard":
+            SecurityComplianceUI._render_security_dashboard(security_mgr, selected_account)
+        elif view == "🔍 Security Findings":
+            SecurityComplianceUI._render_security_findings(security_mgr, selected_account)
+        elif view == "⚠️ GuardDuty Threats":
+            SecurityComplianceUI._render_guardduty(security_mgr, selected_account)
+        elif view == "✅ Config Compliance":
+            SecurityComplianceUI._render_config_compliance(security_mgr, selected_account)
+        elif view == "📊 CloudWatch Alarms":
+            SecurityComplianceUI._render_cloudwatch_alarms(cw_mgr, selected_account)
+        elif view == "📝 CloudWatch Logs":
+            SecurityComplianceUI._render_cloudwatch_logs(cw_mgr, selected_account)
     
     @staticmethod
-    def _render_security_dashboard(security_mgr: SecurityManager):
+    def _render_security_dashboard(security_mgr: SecurityManager, account: str):
         """Security overview dashboard"""
         st.subheader("🛡️ Security Dashboard")
         
-        # Get security score
-        score_data = security_mgr.get_security_score()
+        # Score and Security Hub summary are independent; fetch them concurrently
+        with Helpers.thread_pool(max_workers=2) as executor:
+            score_future = executor.submit(_security_score, security_mgr, account)
+            summary_future = executor.submit(_hub_summary, security_mgr, account)
+        score_data = score_future.result()
+        sh_summary = summary_future.result()
+        
+        score = score_data.get('score', 0)
+        grade = score_data.get('grade')
+        total_findings = score_data.get('total_findings', 0)
+        critical_findings = score_data.get('critical_findings', 0)
+        compliance_pct = score_data.get('compliance_percentage', 0)
         
         # Display score
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            score = score_data.get('score', 0)
-            st.metric("Security Score", f"{score}/100", delta=score_data.get('grade'))
+            st.metric("Security Score", f"{score}/100", delta=grade)
         with col2:
-            st.metric("Total Findings", score_data.get('total_findings', 0))
+            st.metric("Total Findings", total_findings)
         with col3:
-            st.metric("Critical", score_data.get('critical_findings', 0))
+            st.metric("Critical", critical_findings)
         with col4:
-            st.metric("Compliance", f"{score_data.get('compliance_percentage', 0):.1f}%")
+            st.metric("Compliance", f"{compliance_pct:.1f}%")
         
         # Security Hub summary
         st.markdown("### Security Hub Status")
-        sh_summary = security_mgr.get_security_hub_summary()
         
-        if sh_summary.get('total_findings', 0) > 0:
-            severity_counts = sh_summary.get('severity_counts', {})
-            
+        severity_counts = sh_summary.get('severity_counts')
+        if sh_summary.get('total_findings', 0) > 0 and severity_counts:
             # Bar chart of findings by severity
-            severity_df = pd.DataFrame([
-                {'Severity': k, 'Count': v} 
-                for k, v in severity_counts.items()
-            ])
-            st.bar_chart(severity_df.set_index('Severity'))
+            st.bar_chart(pd.Series(severity_counts, name='Count').rename_axis('Severity'))
         else:
             st.info("No security findings found")
     
     @staticmethod
-    def _render_security_findings(security_mgr: SecurityManager):
+    @st.fragment
+    def _render_security_findings(security_mgr: SecurityManager, account: str):
         """Security Hub findings"""
         st.subheader("🔍 Security Findings")
         
@@ -127,46 +237,65 @@ class SecurityComplianceUI:
         
         severity = None if severity_filter == "ALL" else severity_filter
         
-        # Get findings
-        findings = security_mgr.list_security_findings(severity=severity, limit=100)
+        # Show each page as soon as it arrives instead of waiting for all of them
+        total_placeholder = st.empty()
+        table_placeholder = st.empty()
+        findings = []
+        next_token = None
+        while True:
+            page = _security_findings_page(security_mgr, account, severity, next_token)
+            next_token = page['next_token']
+            
+            if page['findings']:
+                findings.extend(page['findings'])
+                total_placeholder.write(f"**Total Findings:** {len(findings)}")
+                findings_df = pd.DataFrame(findings)
+                findings_df['severity'] = findings_df['severity'].map(
+                    lambda sev: f"{_SEVERITY_ICON.get(sev, '⚪')} {sev}"
+                )
+                table_placeholder.dataframe(
+                    findings_df[['severity', 'title', 'resource_type', 'resource_id',
+                                 'workflow_status', 'compliance_status', 'created_at']],
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={'severity': st.column_config.TextColumn(width='small')}
+                )
+            
+            if not next_token or len(findings) >= _FINDINGS_LIMIT:
+                break
         
         if not findings:
             st.success("✅ No security findings!")
             return
         
-        st.write(f"**Total Findings:** {len(findings)}")
-        
-        # Display findings
-        for finding in findings:
-            severity_color = {
-                'CRITICAL': '🔴',
-                'HIGH': '🟠',
-                'MEDIUM': '🟡',
-                'LOW': '🟢',
-                'INFORMATIONAL': '⚪'
-            }.get(finding['severity'], '⚪')
-            
-            with st.expander(f"{severity_color} {finding['title']} - {finding['severity']}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write("**Resource Type:**", finding['resource_type'])
-                    st.write("**Resource ID:**", finding['resource_id'])
-                    st.write("**Status:**", finding['workflow_status'])
-                with col2:
-                    st.write("**Compliance:**", finding['compliance_status'])
-                    st.write("**Created:**", finding['created_at'])
-                    st.write("**Updated:**", finding['updated_at'])
-                
-                st.write("**Description:**", finding['description'])
-                if finding.get('remediation'):
-                    st.write("**Remediation:**", finding['remediation'])
+        # Drill down into a single finding
+        selected = st.selectbox(
+            "View finding",
+            options=range(len(findings)),
+            format_func=lambda i: findings[i]['title'],
+            key="findings_detail"
+        )
+        finding = findings[selected]
+        details = (
+            f"**Resource Type:** {finding['resource_type']}  \n"
+            f"**Resource ID:** `{finding['resource_id']}`  \n"
+            f"**Status:** {finding['workflow_status']}  \n"
+            f"**Compliance:** {finding['compliance_status']}  \n"
+            f"**Created:** {finding['created_at']}  \n"
+            f"**Updated:** {finding['updated_at']}\n\n"
+            f"**Description:** {finding['description']}"
+        )
+        if finding.get('remediation'):
+            details += f"\n\n**Remediation:** {finding['remediation']}"
+        st.markdown(details)
     
     @staticmethod
-    def _render_guardduty(security_mgr: SecurityManager):
+    @st.fragment
+    def _render_guardduty(security_mgr: SecurityManager, account: str):
         """GuardDuty findings"""
         st.subheader("⚠️ GuardDuty Threat Detection")
         
-        detector_id = security_mgr.get_guardduty_detector()
+        detector_id = _guardduty_detector(security_mgr, account)
         
         if not detector_id:
             st.warning("GuardDuty not enabled")
@@ -174,11 +303,12 @@ class SecurityComplianceUI:
                 result = security_mgr.enable_guardduty()
                 if result.get('success'):
                     st.success("✅ GuardDuty enabled")
+                    _guardduty_detector.clear()
                     st.rerun()
             return
         
         # Get findings
-        findings = security_mgr.list_guardduty_findings(detector_id)
+        findings = _guardduty_findings(security_mgr, account, detector_id)
         
         if not findings:
             st.success("✅ No threat findings!")
@@ -186,63 +316,94 @@ class SecurityComplianceUI:
         
         st.write(f"**Total Findings:** {len(findings)}")
         
-        # Display findings
-        for finding in findings:
-            severity_icon = "🔴" if finding['severity'] >= 7 else "🟡" if finding['severity'] >= 4 else "🟢"
-            
-            with st.expander(f"{severity_icon} {finding['title']} (Severity: {finding['severity']})"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write("**Type:**", finding['type'])
-                    st.write("**Resource:**", finding['resource_type'])
-                    st.write("**Region:**", finding['region'])
-                with col2:
-                    st.write("**Created:**", finding['created_at'])
-                    st.write("**Updated:**", finding['updated_at'])
-                    st.write("**Count:**", finding['count'])
-                
-                st.write("**Description:**", finding['description'])
+        # One table instead of an expander per finding
+        gd_df = pd.DataFrame(findings)
+        gd_df.insert(0, 'level', pd.cut(
+            gd_df['severity'], bins=_GUARDDUTY_SEVERITY_BINS,
+            labels=_GUARDDUTY_SEVERITY_ICONS, right=False
+        ))
+        st.dataframe(
+            gd_df[['level', 'severity', 'title', 'type', 'resource_type', 'region', 'count', 'updated_at']],
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'level': st.column_config.TextColumn("", width='small'),
+                'severity': st.column_config.ProgressColumn(
+                    "Severity", format="%.1f", min_value=0, max_value=10
+                )
+            }
+        )
+        
+        # Drill down into a single finding
+        selected = st.selectbox(
+            "View finding",
+            options=range(len(findings)),
+            format_func=lambda i: findings[i]['title'],
+            key="guardduty_detail"
+        )
+        finding = findings[selected]
+        st.markdown(
+            f"**Type:** {finding['type']}  \n"
+            f"**Resource:** {finding['resource_type']}  \n"
+            f"**Region:** {finding['region']}  \n"
+            f"**Created:** {finding['created_at']}  \n"
+            f"**Updated:** {finding['updated_at']}  \n"
+            f"**Count:** {finding['count']}\n\n"
+            f"**Description:** {finding['description']}"
+        )
     
     @staticmethod
-    def _render_config_compliance(security_mgr: SecurityManager):
+    def _render_config_compliance(security_mgr: SecurityManager, account: str):
         """AWS Config compliance"""
         st.subheader("✅ Config Compliance")
         
-        # Get compliance summary
-        summary = security_mgr.get_compliance_summary()
+        # Summary, rules and non-compliant resources are independent; fetch them concurrently
+        with Helpers.thread_pool(max_workers=3) as executor:
+            summary_future = executor.submit(_compliance_summary, security_mgr, account)
+            rules_future = executor.submit(_config_rules, security_mgr, account)
+            non_compliant_future = executor.submit(_non_compliant_resources, security_mgr, account)
+        summary = summary_future.result()
         
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Rules", summary.get('total_rules', 0))
+            st.metric("Total Rules", summary.total_rules)
         with col2:
-            st.metric("Compliant", summary.get('compliance_counts', {}).get('COMPLIANT', 0))
+            st.metric("Compliant", summary.compliant)
         with col3:
-            st.metric("Non-Compliant", summary.get('compliance_counts', {}).get('NON_COMPLIANT', 0))
+            st.metric("Non-Compliant", summary.non_compliant)
         with col4:
-            compliance_pct = summary.get('compliance_percentage', 0)
-            st.metric("Compliance %", f"{compliance_pct:.1f}%")
+            st.metric("Compliance %", f"{summary.compliance_percentage:.1f}%")
         
         # Config rules
         st.markdown("### Config Rules")
-        rules = security_mgr.list_config_rules()
+        rules = rules_future.result()
         
         if rules:
-            rules_df = pd.DataFrame(rules)
-            st.dataframe(rules_df[['name', 'source', 'state']], use_container_width=True)
+            rules_df = pd.DataFrame.from_records(rules, columns=_CONFIG_RULE_COLUMNS)
+            st.dataframe(rules_df, use_container_width=True, hide_index=True)
         
         # Non-compliant resources
         st.markdown("### Non-Compliant Resources")
-        non_compliant = security_mgr.get_non_compliant_resources()
+        non_compliant = non_compliant_future.result()
         
         if non_compliant:
-            nc_df = pd.DataFrame(non_compliant)
-            st.dataframe(nc_df, use_container_width=True)
+            nc_df = pd.DataFrame.from_records(non_compliant)
+            st.dataframe(
+                nc_df,
+                use_container_width=True,
+                column_config={
+                    'compliance_contributor_count': st.column_config.NumberColumn(
+                        "Non-Compliant Rules", format="%d"
+                    )
+                }
+            )
         else:
             st.success("✅ All resources compliant!")
     
     @staticmethod
-    def _render_cloudwatch_alarms(cw_mgr: CloudWatchManager):
+    @st.fragment
+    def _render_cloudwatch_alarms(cw_mgr: CloudWatchManager, account: str):
         """CloudWatch alarms"""
         st.subheader("📊 CloudWatch Alarms")
         
@@ -256,48 +417,53 @@ class SecurityComplianceUI:
         state = None if state_filter == "ALL" else state_filter
         
         # Get alarms
-        alarms = cw_mgr.list_alarms(state_value=state)
+        alarms = _alarms(cw_mgr, account, state)
         
         if not alarms:
             st.info("No alarms found")
             return
         
         # Metrics
+        state_counts = Counter(a['state'] for a in alarms)
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Total Alarms", len(alarms))
         with col2:
-            alarm_count = sum(1 for a in alarms if a['state'] == 'ALARM')
-            st.metric("In ALARM", alarm_count)
+            st.metric("In ALARM", state_counts['ALARM'])
         with col3:
-            ok_count = sum(1 for a in alarms if a['state'] == 'OK')
-            st.metric("OK", ok_count)
+            st.metric("OK", state_counts['OK'])
         
-        # Display alarms
-        for alarm in alarms:
-            state_icon = "🔴" if alarm['state'] == 'ALARM' else "🟢" if alarm['state'] == 'OK' else "🟡"
-            
-            with st.expander(f"{state_icon} {alarm['alarm_name']} - {alarm['state']}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write("**Metric:**", alarm['metric_name'])
-                    st.write("**Namespace:**", alarm['namespace'])
-                    st.write("**Statistic:**", alarm['statistic'])
-                with col2:
-                    st.write("**Threshold:**", alarm['threshold'])
-                    st.write("**Comparison:**", alarm['comparison_operator'])
-                    st.write("**Actions Enabled:**", alarm['actions_enabled'])
-                
-                if alarm.get('state_reason'):
-                    st.write("**Reason:**", alarm['state_reason'])
+        # One table instead of an expander per alarm
+        alarms_df = pd.DataFrame(alarms)
+        alarms_df['state'] = alarms_df['state'].map(
+            lambda state: f"{_ALARM_STATE_ICON.get(state, '🟡')} {state}"
+        )
+        st.dataframe(
+            alarms_df[['state', 'alarm_name', 'metric_name', 'namespace', 'statistic',
+                       'comparison_operator', 'threshold', 'actions_enabled']],
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # Drill down into a single alarm
+        selected = st.selectbox(
+            "View alarm",
+            options=range(len(alarms)),
+            format_func=lambda i: alarms[i]['alarm_name'],
+            key="alarms_detail"
+        )
+        alarm = alarms[selected]
+        if alarm.get('state_reason'):
+            st.markdown(f"**Reason:** {alarm['state_reason']}")
     
     @staticmethod
-    def _render_cloudwatch_logs(cw_mgr: CloudWatchManager):
+    @st.fragment
+    def _render_cloudwatch_logs(cw_mgr: CloudWatchManager, account: str):
         """CloudWatch logs"""
         st.subheader("📝 CloudWatch Logs")
         
         # List log groups
-        log_groups = cw_mgr.list_log_groups()
+        log_groups = _log_group_names(cw_mgr, account)
         
         if not log_groups:
             st.info("No log groups found")
@@ -308,28 +474,46 @@ class SecurityComplianceUI:
         # Select log group
         selected_lg = st.selectbox(
             "Select Log Group",
-            options=[lg['log_group_name'] for lg in log_groups],
+            options=log_groups,
             key="selected_log_group"
         )
         
         if selected_lg:
             # List streams
-            streams = cw_mgr.list_log_streams(selected_lg)
+            streams = _log_stream_names(cw_mgr, account, selected_lg)
             
             if streams:
                 st.write(f"**Log Streams:** {len(streams)}")
                 
                 selected_stream = st.selectbox(
                     "Select Log Stream",
-                    options=[s['log_stream_name'] for s in streams],
+                    options=streams,
                     key="selected_stream"
                 )
                 
+                filter_pattern = st.text_input(
+                    "Filter (CloudWatch pattern syntax)",
+                    key="log_filter_pattern",
+                    placeholder="ERROR",
+                    help="Searches the last hour of the selected stream"
+                )
+                
                 if selected_stream and st.button("Get Recent Events"):
-                    events = cw_mgr.get_log_events(selected_lg, selected_stream, limit=50)
+                    # A pattern is matched by CloudWatch itself; without one just tail the stream
+                    if filter_pattern:
+                        events = cw_mgr.filter_log_events(
+                            selected_lg, filter_pattern,
+                            start_time=datetime.now() - _LOG_SEARCH_WINDOW,
+                            limit=50,
+                            log_stream_names=[selected_stream]
+                        )
+                    else:
+                        events = cw_mgr.get_log_events(selected_lg, selected_stream, limit=50)
                     
                     if events:
-                        for event in events:
-                            st.text(f"{event['timestamp']}: {event['message']}")
+                        st.code(
+                            "\n".join(f"{event['timestamp']}: {event['message'].rstrip()}" for event in events),
+                            language="log"
+                        )
                     else:
                         st.info("No events found")
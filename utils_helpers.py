@@ -4,7 +4,9 @@ Helper Utilities
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 class Helpers:
     """General helper functions"""
@@ -142,6 +144,21 @@ class Helpers:
         """Show info message"""
         st.info(f"ℹ️ {message}")
     
+    @staticmethod
+    def thread_pool(max_workers: int = 8) -> ThreadPoolExecutor:
+        """
+        Create a thread pool for concurrent AWS calls
+        
+        Worker threads inherit the current script run context so that
+        st.* calls made by the service managers (e.g. st.error) still
+        reach the page.
+        """
+        return ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        )
+    
     @staticmethod
     def create_download_link(data: Any, filename: str, label: str = "Download"):
         """Create download button"""